@@ -2,9 +2,11 @@
 V1 API router - aggregates all v1 endpoints.
 """
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from app.api.v1.endpoints import contract_truth, social_sentiment, liquidity_intel
 
-api_router = APIRouter()
+# orjson serializes the large nested responses natively instead of via the stdlib json encoder
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include all v1 endpoints
 api_router.include_router(contract_truth.router, tags=["Contract Truth"])
@@ -2,13 +2,17 @@
 Contract Truth endpoint - /v1/contracts/truth:analyze
 Multi-chain contract analysis (strict spec).
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter
 from datetime import datetime, timezone
-from typing import List, Optional, Tuple, Dict
-import hashlib
+from typing import List, Optional, Tuple, Dict, NamedTuple
+import asyncio
+import functools
+import itertools
+import re
 import uuid
 
-from app.api.v1.schemas.requests import ContractTruthRequest
+from app.api.v1.rendering import render
+from app.api.v1.schemas.requests import ContractTruthRequest, ChainInstance
 from app.api.v1.schemas.responses import (
     ContractTruthResponse,
     ContractTruthDataSection,
@@ -25,14 +29,88 @@ from app.api.v1.schemas.responses import (
     RiskFlag,
     Evidence,
     StructuredError,
-    ErrorCode
+    ErrorCode,
+    iso_timestamp
 )
 from app.services.contract_truth import ContractTruthService
 from app.services.solana_client import SolanaClient
-from app.core.enums import DataCertainty
-from web3 import Web3
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from eth_hash.auto import keccak
+from eth_utils import is_address, to_checksum_address
 
 router = APIRouter()
+# Schemas defer their validators; build the request model now rather than on first request
+ContractTruthRequest.model_rebuild()
+
+# Proxy standard named in the analyzer's evidence string -> spec proxy_type
+_PROXY_STANDARD_RE = re.compile(r"EIP-(1967|1822|897)")
+_PROXY_TYPES = {"1967": "transparent", "1822": "uups", "897": "beacon"}
+
+# Every risk flag id this endpoint emits, each mapped to one bit for similarity scoring
+_RISK_FLAG_IDS = (
+    "MINT_PRIVILEGE",
+    "PROXY_UPGRADEABLE",
+    "UPGRADEABLE_NO_TIMELOCK_EVIDENCE",
+    "UNVERIFIED_SOURCE",
+    "FREEZE_AUTHORITY_PRESENT",
+    "UPGRADE_AUTHORITY_PRESENT",
+)
+_FLAG_BIT = {flag_id: 1 << bit for bit, flag_id in enumerate(_RISK_FLAG_IDS)}
+
+# Static risk flags (RiskFlag is frozen, so these are shared across responses)
+_FLAG_EVM_MINT_PRIVILEGE = RiskFlag(id="MINT_PRIVILEGE", severity="medium", why="Contract has mint capability")
+_FLAG_EVM_NO_TIMELOCK = RiskFlag(
+    id="UPGRADEABLE_NO_TIMELOCK_EVIDENCE",
+    severity="high",
+    why="Upgradeable proxy without detected timelock protection"
+)
+_FLAG_EVM_UNVERIFIED_SOURCE = RiskFlag(id="UNVERIFIED_SOURCE", severity="high", why="Source code not verified on explorer")
+_FLAG_EVM_FREEZE_AUTHORITY = RiskFlag(
+    id="FREEZE_AUTHORITY_PRESENT",
+    severity="high",
+    why="Contract can freeze or blacklist addresses"
+)
+_FLAG_SOLANA_MINT_AUTHORITY = RiskFlag(id="MINT_PRIVILEGE", severity="medium", why="Mint authority is set")
+_FLAG_SOLANA_FREEZE_AUTHORITY = RiskFlag(id="FREEZE_AUTHORITY_PRESENT", severity="high", why="Freeze authority is set")
+_FLAG_SOLANA_UPGRADE_AUTHORITY = RiskFlag(
+    id="UPGRADE_AUTHORITY_PRESENT",
+    severity="medium",
+    why="Program has upgrade authority set"
+)
+
+# All-default sections every instance reports today (frozen, so shared like the flags)
+_FIXED_FEE_CONTROLS = FeeControls(can_change_fees=False)
+_NO_SUPPLY_ACTIVITY = SupplyActivity()
+
+# Analysis results per (chain, address, options); contract facts change on the order of hours
+_instance_cache = AsyncTTLCache(ttl_seconds=settings.cache_ttl_seconds)
+
+
+# Long-lived ContractTruthService per chain; a dict rather than lru_cache so shutdown can close them
+_ct_services: Dict[str, ContractTruthService] = {}
+
+
+def _get_ct_service(chain: str) -> ContractTruthService:
+    """Return a long-lived ContractTruthService per chain so RPC/explorer connections are reused."""
+    service = _ct_services.get(chain)
+    if service is None:
+        service = _ct_services[chain] = ContractTruthService(chain)
+    return service
+
+
+@functools.lru_cache(maxsize=1)
+def _get_solana_client() -> SolanaClient:
+    """Return the shared SolanaClient."""
+    return SolanaClient()
+
+
+async def close_clients() -> None:
+    """Close the shared upstream HTTP clients (called on app shutdown)."""
+    for service in _ct_services.values():
+        await service.close()
+    if _get_solana_client.cache_info().currsize:
+        await _get_solana_client().close()
 
 
 @router.post("/contracts/truth:analyze", response_model=ContractTruthResponse)
@@ -51,63 +129,123 @@ async def analyze_contract_truth(request: ContractTruthRequest):
     - evidence[], warnings[], errors[]
     """
     request_id = str(uuid.uuid4())
-    as_of = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
+    as_of = now.isoformat()
+    stamp = iso_timestamp(now)
     
     proven_instances: List[ProvenInstance] = []
     all_evidence: List[Evidence] = []
     all_warnings: List[str] = []
     all_errors: List[StructuredError] = []
     
-    # Analyze each chain instance
+    # Analyze each distinct (chain, address) once, all concurrently (each one is I/O bound)
+    unique_instances: Dict[Tuple[str, str], ChainInstance] = {}
     for instance in request.instances:
-        try:
-            if instance.chain.lower() == "solana":
-                proven = await _analyze_solana_instance(instance, request.options, request.lookback_days)
-            else:
-                proven = await _analyze_evm_instance(instance, request.options, request.lookback_days)
-            
-            proven_instances.append(proven)
-            
-        except Exception as e:
+        unique_instances.setdefault(_instance_identity(instance), instance)
+    
+    results = await asyncio.gather(
+        *[_analyze_instance(instance, request.options, request.lookback_days) for instance in unique_instances.values()],
+        return_exceptions=True
+    )
+    result_by_identity = dict(zip(unique_instances, results))
+    
+    # Expand back to the request order, duplicates included
+    for instance in request.instances:
+        result = result_by_identity[_instance_identity(instance)]
+        if isinstance(result, Exception):
             error = StructuredError(
                 code=ErrorCode.INTERNAL_ERROR,
                 message=f"Failed to analyze {instance.chain}:{instance.address}",
                 source=instance.chain,
-                retryable=True
+                retryable=True,
+                timestamp=stamp
             )
             all_errors.append(error)
-            all_warnings.append(f"Skipped {instance.chain}:{instance.address} due to error: {str(e)}")
+            all_warnings.append(f"Skipped {instance.chain}:{instance.address} due to error: {str(result)}")
+        else:
+            proven_instances.append(_relabel_instance(result, instance))
     
     # Add evidence
     if proven_instances:
         all_evidence.append(Evidence(
             provider="contract_truth",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=stamp,
             note=f"Analyzed {len(proven_instances)} chain instance(s)"
         ))
     
-    # Infer cross-chain equivalence if multiple instances
+    # Infer cross-chain equivalence if multiple instances (and the caller wants it)
     cross_chain_eq = []
-    if len(proven_instances) >= 2:
+    if request.options.infer_cross_chain and len(proven_instances) >= 2:
         cross_chain_eq = _infer_cross_chain_equivalence(proven_instances)
     
-    return ContractTruthResponse(
+    # Every part is already a validated model; construct the wrappers without re-validating
+    response = ContractTruthResponse.model_construct(
         request_id=request_id,
         as_of=as_of,
-        data=ContractTruthDataSection(
-            proven=ProvenSection(instances=proven_instances),
-            inferred=InferredSection(cross_chain_equivalence=cross_chain_eq)
+        data=ContractTruthDataSection.model_construct(
+            proven=ProvenSection.model_construct(instances=proven_instances),
+            inferred=InferredSection.model_construct(cross_chain_equivalence=cross_chain_eq)
         ),
         evidence=all_evidence,
         warnings=all_warnings,
         errors=all_errors
     )
+    # Skip FastAPI's response_model round-trip
+    return render(response)
+
+
+async def _analyze_instance(instance, options, lookback_days: int) -> ProvenInstance:
+    """Analyze a single chain instance, serving repeat lookups from the TTL cache."""
+    chain, address = _instance_identity(instance)
+    # Analyze the normalized spelling so the cached result doesn't depend on which one arrived first
+    if address != instance.address:
+        instance = instance.model_copy(update={"address": address})
+    proven, _ = await _instance_cache.get_or_set(
+        (chain, address, options.compute_code_hash, lookback_days),
+        lambda: _dispatch_instance(instance, options, lookback_days),
+        cache_if=lambda result: not result[1]
+    )
+    return proven
+
+
+def _instance_identity(instance: ChainInstance) -> Tuple[str, str]:
+    """
+    Normalized (chain, address). Valid EVM addresses are checksummed (web3 rejects
+    other mixed/lower-case spellings); Solana (base58) addresses are case-sensitive.
+    """
+    address = instance.address
+    if instance.chain != "solana" and is_address(address):
+        address = to_checksum_address(address)
+    return instance.chain, address
+
+
+def _relabel_instance(proven: ProvenInstance, instance: ChainInstance) -> ProvenInstance:
+    """Echo the caller's chain/address/type spelling on a shared (deduplicated or cached) result."""
+    if (proven.chain, proven.address, proven.type) == (instance.chain, instance.address, instance.type):
+        return proven
+    return proven.model_copy(update={
+        "chain": instance.chain,
+        "address": instance.address,
+        "type": instance.type
+    })
 
 
-async def _analyze_evm_instance(instance, options, lookback_days: int) -> ProvenInstance:
-    """Analyze EVM chain contract - returns PROVEN facts only."""
-    service = ContractTruthService(instance.chain)
+async def _dispatch_instance(instance, options, lookback_days: int) -> Tuple[ProvenInstance, List[str]]:
+    """
+    Dispatch a single chain instance to the Solana or EVM analyzer.
+    Returns (instance, upstream errors); a result built on failed lookups isn't cached.
+    """
+    if instance.chain == "solana":
+        # Solana RPC failures raise, so a returned result is always complete
+        return await _analyze_solana_instance(instance, options, lookback_days), []
+    return await _analyze_evm_instance(instance, options, lookback_days)
+
+
+async def _analyze_evm_instance(instance, options, lookback_days: int) -> Tuple[ProvenInstance, List[str]]:
+    """Analyze EVM chain contract - returns PROVEN facts only, plus any upstream errors."""
+    service = _get_ct_service(instance.chain)
     old_result = await service.analyze_contract(instance.address)
+    upstream_errors = list(old_result.upstream_errors)
     
     # Verification data
     verification = VerificationData(
@@ -117,14 +255,21 @@ async def _analyze_evm_instance(instance, options, lookback_days: int) -> Proven
         source_hash=None  # TODO: Extract from explorer response
     )
     
+    is_proxy = old_result.is_proxy.value or False
+    admin_addr = old_result.owner_address.value if is_proxy else None
+    
+    # Fetch contract code (for hashing) and admin code (for timelock detection) together
+    code, admin_code = await service.get_codes([
+        instance.address if options.compute_code_hash else None,
+        admin_addr
+    ])
+    if (options.compute_code_hash and code is None) or (admin_addr and admin_code is None):
+        upstream_errors.append(f"{instance.chain} RPC error fetching contract code")
+    
     # Code identity
     code_hash = None
-    if options.compute_code_hash:
-        try:
-            code = service.web3.eth.get_code(instance.address)
-            code_hash = f"keccak256:{hashlib.sha256(code).hexdigest()}"
-        except:
-            pass
+    if code is not None:
+        code_hash = f"keccak256:{keccak(code).hex()}"
     
     code_identity = CodeIdentity(
         runtime_code_hash=code_hash,
@@ -133,32 +278,19 @@ async def _analyze_evm_instance(instance, options, lookback_days: int) -> Proven
     )
     
     # Upgradeability detection
-    is_proxy = old_result.is_proxy.value or False
     proxy_type = None
     if is_proxy:
-        if "EIP-1967" in str(old_result.is_proxy.reason):
-            proxy_type = "transparent"
-        elif "EIP-1822" in str(old_result.is_proxy.reason):
-            proxy_type = "uups"
-        elif "EIP-897" in str(old_result.is_proxy.reason):
-            proxy_type = "beacon"
-        else:
-            proxy_type = "unknown"
+        match = _PROXY_STANDARD_RE.search(str(old_result.is_proxy.reason))
+        proxy_type = _PROXY_TYPES[match.group(1)] if match else "unknown"
     
     # Check if admin is a contract (timelock detection)
     admin_is_contract = None
     timelock_detected = False
-    admin_addr = None
-    
-    if is_proxy and old_result.owner_address.value:
-        admin_addr = old_result.owner_address.value
-        try:
-            admin_code = service.web3.eth.get_code(admin_addr)
-            admin_is_contract = len(admin_code) > 2
-            if admin_is_contract:
-                timelock_detected = True  # Assume contract admin = timelock
-        except:
-            pass
+    
+    if admin_code is not None:
+        admin_is_contract = len(admin_code) > 2
+        if admin_is_contract:
+            timelock_detected = True  # Assume contract admin = timelock
     
     upgradeability = UpgradeabilityData(
         is_proxy=is_proxy,
@@ -177,19 +309,11 @@ async def _analyze_evm_instance(instance, options, lookback_days: int) -> Proven
         can_burn=old_result.has_burn_function.value,
         can_pause=old_result.has_pause_function.value,
         can_blacklist_or_freeze=old_result.has_freeze_function.value,
-        fee_controls=FeeControls(
-            can_change_fees=False,  # TODO: Detect from ABI
-            max_fee_bps=None
-        )
+        fee_controls=_FIXED_FEE_CONTROLS  # TODO: Detect from ABI
     )
     
     # Supply activity (simplified - no event history yet)
-    supply_activity = SupplyActivity(
-        mint_events_lookback=None,  # TODO: Implement event tracking
-        mint_amount_lookback=None,
-        burn_events_lookback=None,
-        burn_amount_lookback=None
-    )
+    supply_activity = _NO_SUPPLY_ACTIVITY  # TODO: Implement event tracking
     
     # Risk flags
     risk_flags = _generate_risk_flags_evm(
@@ -198,7 +322,7 @@ async def _analyze_evm_instance(instance, options, lookback_days: int) -> Proven
         verification=verification
     )
     
-    return ProvenInstance(
+    proven = ProvenInstance(
         chain=instance.chain,
         address=instance.address,
         type=instance.type,
@@ -209,11 +333,12 @@ async def _analyze_evm_instance(instance, options, lookback_days: int) -> Proven
         supply_activity=supply_activity,
         risk_flags=risk_flags
     )
+    return proven, upstream_errors
 
 
 async def _analyze_solana_instance(instance, options, lookback_days: int) -> ProvenInstance:
     """Analyze Solana SPL token - returns PROVEN facts only."""
-    client = SolanaClient()
+    client = _get_solana_client()
     
     # Analyze SPL token mint
     spl_data = await client.analyze_spl_token(instance.address)
@@ -260,19 +385,11 @@ async def _analyze_solana_instance(instance, options, lookback_days: int) -> Pro
         can_burn=True,  # SPL tokens can always burn
         can_pause=False,
         can_blacklist_or_freeze=freeze_authority is not None,
-        fee_controls=FeeControls(
-            can_change_fees=False,
-            max_fee_bps=None
-        )
+        fee_controls=_FIXED_FEE_CONTROLS
     )
     
     # Supply activity
-    supply_activity = SupplyActivity(
-        mint_events_lookback=None,
-        mint_amount_lookback=None,
-        burn_events_lookback=None,
-        burn_amount_lookback=None
-    )
+    supply_activity = _NO_SUPPLY_ACTIVITY
     
     # Risk flags
     risk_flags = _generate_risk_flags_solana(
@@ -304,11 +421,7 @@ def _generate_risk_flags_evm(
     
     # Mint privilege
     if controls.can_mint:
-        flags.append(RiskFlag(
-            id="MINT_PRIVILEGE",
-            severity="medium",
-            why="Contract has mint capability"
-        ))
+        flags.append(_FLAG_EVM_MINT_PRIVILEGE)
     
     # Proxy upgradeable
     if upgradeability.is_proxy:
@@ -320,27 +433,15 @@ def _generate_risk_flags_evm(
         
         # No timelock
         if not upgradeability.timelock_detected:
-            flags.append(RiskFlag(
-                id="UPGRADEABLE_NO_TIMELOCK_EVIDENCE",
-                severity="high",
-                why="Upgradeable proxy without detected timelock protection"
-            ))
+            flags.append(_FLAG_EVM_NO_TIMELOCK)
     
     # Unverified
     if not verification.verified_source:
-        flags.append(RiskFlag(
-            id="UNVERIFIED_SOURCE",
-            severity="high",
-            why="Source code not verified on explorer"
-        ))
+        flags.append(_FLAG_EVM_UNVERIFIED_SOURCE)
     
     # Freeze/blacklist
     if controls.can_blacklist_or_freeze:
-        flags.append(RiskFlag(
-            id="FREEZE_AUTHORITY_PRESENT",
-            severity="high",
-            why="Contract can freeze or blacklist addresses"
-        ))
+        flags.append(_FLAG_EVM_FREEZE_AUTHORITY)
     
     return flags
 
@@ -355,71 +456,85 @@ def _generate_risk_flags_solana(
     
     # Mint authority
     if controls.can_mint:
-        flags.append(RiskFlag(
-            id="MINT_PRIVILEGE",
-            severity="medium",
-            why="Mint authority is set"
-        ))
+        flags.append(_FLAG_SOLANA_MINT_AUTHORITY)
     
     # Freeze authority
     if controls.can_blacklist_or_freeze:
-        flags.append(RiskFlag(
-            id="FREEZE_AUTHORITY_PRESENT",
-            severity="high",
-            why="Freeze authority is set"
-        ))
+        flags.append(_FLAG_SOLANA_FREEZE_AUTHORITY)
     
     # Upgrade authority
     if upgradeability.upgrade_authority:
-        flags.append(RiskFlag(
-            id="UPGRADE_AUTHORITY_PRESENT",
-            severity="medium",
-            why="Program has upgrade authority set"
-        ))
+        flags.append(_FLAG_SOLANA_UPGRADE_AUTHORITY)
     
     return flags
 
 
+class _SimilarityFeatures(NamedTuple):
+    """Per-instance values compared by _score_similarity, extracted once per request."""
+    key: str
+    chain: str
+    can_mint: Optional[bool]
+    can_pause: Optional[bool]
+    can_freeze: Optional[bool]
+    is_proxy: bool
+    flags_mask: int
+
+
+def _extract_similarity_features(inst: ProvenInstance) -> _SimilarityFeatures:
+    """Pull the compared fields out of a ProvenInstance."""
+    return _SimilarityFeatures(
+        key=f"{inst.chain}:{inst.address}",
+        chain=inst.chain,
+        can_mint=inst.controls.can_mint,
+        can_pause=inst.controls.can_pause,
+        can_freeze=inst.controls.can_blacklist_or_freeze,
+        is_proxy=inst.upgradeability.is_proxy,
+        flags_mask=_flags_to_mask(inst.risk_flags)
+    )
+
+
+def _flags_to_mask(risk_flags: List[RiskFlag]) -> int:
+    """Pack risk flag ids into a bitmask."""
+    mask = 0
+    for flag in risk_flags:
+        mask |= _FLAG_BIT[flag.id]
+    return mask
+
+
+def _mask_to_flags(mask: int) -> List[str]:
+    """Unpack a bitmask into flag ids, in _RISK_FLAG_IDS order."""
+    return [flag_id for flag_id in _RISK_FLAG_IDS if mask & _FLAG_BIT[flag_id]]
+
+
 def _infer_cross_chain_equivalence(instances: List[ProvenInstance]) -> List[CrossChainEquivalence]:
-    """Infer cross-chain equivalence (INFERRED conclusions)."""
-    if len(instances) < 2:
-        return []
-    
+    """Infer cross-chain equivalence (INFERRED conclusions). Callers ensure len(instances) >= 2."""
     equivalences = []
+    features = [_extract_similarity_features(inst) for inst in instances]
     
     # Compare all pairs
-    for i in range(len(instances)):
-        for j in range(i + 1, len(instances)):
-            inst_a = instances[i]
-            inst_b = instances[j]
-            
-            pair_id = [
-                f"{inst_a.chain}:{inst_a.address}",
-                f"{inst_b.chain}:{inst_b.address}"
-            ]
-            
-            # Score similarity
-            confidence, reasons = _score_similarity(inst_a, inst_b)
-            
-            # Classify
-            if confidence >= 0.8:
-                label = "proven_same_asset"
-            elif confidence >= 0.5:
-                label = "likely_same_asset"
-            else:
-                label = "unknown"
-            
-            equivalences.append(CrossChainEquivalence(
-                pair=pair_id,
-                confidence=round(confidence, 2),
-                reasons=reasons,
-                label=label
-            ))
+    for feat_a, feat_b in itertools.combinations(features, 2):
+        # Score similarity
+        confidence, reasons = _score_similarity(feat_a, feat_b)
+        
+        # Classify
+        if confidence >= 0.8:
+            label = "proven_same_asset"
+        elif confidence >= 0.5:
+            label = "likely_same_asset"
+        else:
+            label = "unknown"
+        
+        equivalences.append(CrossChainEquivalence(
+            pair=[feat_a.key, feat_b.key],
+            confidence=round(confidence, 2),
+            reasons=reasons,
+            label=label
+        ))
     
     return equivalences
 
 
-def _score_similarity(inst_a: ProvenInstance, inst_b: ProvenInstance) -> Tuple[float, List[str]]:
+def _score_similarity(feat_a: _SimilarityFeatures, feat_b: _SimilarityFeatures) -> Tuple[float, List[str]]:
     """Score similarity between two instances."""
     score = 0.0
     max_score = 0.0
@@ -430,19 +545,19 @@ def _score_similarity(inst_a: ProvenInstance, inst_b: ProvenInstance) -> Tuple[f
     controls_match = 0
     controls_total = 0
     
-    if inst_a.controls.can_mint == inst_b.controls.can_mint:
+    if feat_a.can_mint == feat_b.can_mint:
         controls_match += 1
     else:
-        reasons.append(f"Mint capability differs: {inst_a.chain}={inst_a.controls.can_mint}, {inst_b.chain}={inst_b.controls.can_mint}")
+        reasons.append(f"Mint capability differs: {feat_a.chain}={feat_a.can_mint}, {feat_b.chain}={feat_b.can_mint}")
     controls_total += 1
     
-    if inst_a.controls.can_pause == inst_b.controls.can_pause:
+    if feat_a.can_pause == feat_b.can_pause:
         controls_match += 1
     else:
         reasons.append(f"Pause capability differs")
     controls_total += 1
     
-    if inst_a.controls.can_blacklist_or_freeze == inst_b.controls.can_blacklist_or_freeze:
+    if feat_a.can_freeze == feat_b.can_freeze:
         controls_match += 1
     else:
         reasons.append(f"Freeze capability differs")
@@ -452,22 +567,19 @@ def _score_similarity(inst_a: ProvenInstance, inst_b: ProvenInstance) -> Tuple[f
     
     # Upgradeability similarity (30% weight)
     max_score += 0.3
-    if inst_a.upgradeability.is_proxy == inst_b.upgradeability.is_proxy:
+    if feat_a.is_proxy == feat_b.is_proxy:
         score += 0.3
     else:
-        reasons.append(f"Upgradeability differs: {inst_a.chain}={inst_a.upgradeability.is_proxy}, {inst_b.chain}={inst_b.upgradeability.is_proxy}")
+        reasons.append(f"Upgradeability differs: {feat_a.chain}={feat_a.is_proxy}, {feat_b.chain}={feat_b.is_proxy}")
     
     # Risk flags similarity (30% weight)
     max_score += 0.3
-    flags_a = {f.id for f in inst_a.risk_flags}
-    flags_b = {f.id for f in inst_b.risk_flags}
-    
-    if flags_a == flags_b:
+    if feat_a.flags_mask == feat_b.flags_mask:
         score += 0.3
-        reasons.append(f"Risk profiles match ({len(flags_a)} flags)")
+        reasons.append(f"Risk profiles match ({bin(feat_a.flags_mask).count('1')} flags)")
     else:
-        diff = flags_a.symmetric_difference(flags_b)
-        reasons.append(f"Risk profiles differ: {diff}")
+        diff = ", ".join(repr(flag_id) for flag_id in _mask_to_flags(feat_a.flags_mask ^ feat_b.flags_mask))
+        reasons.append(f"Risk profiles differ: {{{diff}}}")
     
     # Normalize
     confidence = score / max_score if max_score > 0 else 0.0
@@ -5,9 +5,15 @@ DEX + CEX liquidity analysis with deep pool math (strict spec).
 from fastapi import APIRouter, HTTPException
 from datetime import datetime, timezone
 from typing import List, Dict, Tuple
+import asyncio
+import functools
+import heapq
 import math
 import uuid
+from bisect import bisect_right
+from operator import itemgetter
 
+from app.api.v1.rendering import render
 from app.api.v1.schemas.requests import LiquidityIntelRequest
 from app.api.v1.schemas.responses import (
     LiquidityIntelResponse,
@@ -21,13 +27,129 @@ from app.api.v1.schemas.responses import (
     LiquidityScore,
     Evidence,
     StructuredError,
-    ErrorCode
+    ErrorCode,
+    iso_timestamp
 )
 from app.services.dexscreener_client import DexScreenerClient
 from app.services.defillama_client import DefiLlamaClient
 from app.services.thegraph_client import TheGraphClient
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
 
 router = APIRouter()
+# Schemas defer their validators; build the request model now rather than on first request
+LiquidityIntelRequest.model_rebuild()
+
+# Static flags (LiquidityFlag is frozen, so these are shared across responses)
+_FLAG_DEX_FETCH_FAILED = LiquidityFlag(
+    type="dex_liquidity_low",
+    severity="high",
+    reason="Failed to fetch DEX data"
+)
+_FLAG_DEX_NO_PAIRS = LiquidityFlag(
+    type="dex_liquidity_low",
+    severity="high",
+    reason="Total liquidity $0 below $100K threshold"
+)
+
+# Shared fallback for missing nested objects in upstream JSON (never mutated)
+_EMPTY: Dict = {}
+
+# Scoring tables: bisect_right on the thresholds picks the score for ">= threshold"
+_LIQUIDITY_TIER_THRESHOLDS = (100_000, 500_000, 1_000_000, 10_000_000)
+_LIQUIDITY_TIER_SCORES = (0.05, 0.15, 0.25, 0.35, 0.5)
+_SCORE_LABEL_THRESHOLDS = (0.4, 0.7)
+_SCORE_LABELS = ("low", "medium", "high")
+# Indexed by the number of highly concentrated DEX providers (capped at the last entry)
+_CONCENTRATION_SCORES = (0.15, 0.05, 0.0)
+
+# Upstream responses keyed by (chain, token); failed lookups are never cached
+_pairs_cache = AsyncTTLCache(ttl_seconds=settings.dex_pairs_cache_ttl_seconds, maxsize=10_000)
+_price_cache = AsyncTTLCache(ttl_seconds=settings.price_cache_ttl_seconds, maxsize=10_000)
+_pools_cache = AsyncTTLCache(ttl_seconds=settings.pools_cache_ttl_seconds, maxsize=10_000)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_dex_client() -> DexScreenerClient:
+    """Return the shared DexScreenerClient."""
+    return DexScreenerClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_llama_client() -> DefiLlamaClient:
+    """Return the shared DefiLlamaClient."""
+    return DefiLlamaClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_graph_client() -> TheGraphClient:
+    """Return the shared TheGraphClient."""
+    return TheGraphClient()
+
+
+# The cached lookups below put the upstream deadline inside the cache factory, so it bounds
+# the upstream call itself and not time spent queued behind another request's lookup.
+# A blown deadline raises asyncio.TimeoutError, which is never cached.
+
+async def _cached_token_pairs(chain: str, address: str) -> Dict:
+    """Dexscreener pairs for a token, cached briefly."""
+    return await _pairs_cache.get_or_set(
+        (chain, address),
+        lambda: asyncio.wait_for(
+            _get_dex_client().get_token_pairs(chain, address),
+            settings.upstream_timeout_seconds
+        ),
+        cache_if=lambda data: not data.get("error")
+    )
+
+
+async def _cached_token_price(chain: str, address: str) -> Tuple:
+    """DefiLlama (price, error) for a token, cached when the lookup succeeded."""
+    return await _price_cache.get_or_set(
+        (chain, address),
+        lambda: asyncio.wait_for(
+            _get_llama_client().get_token_price(chain, address),
+            settings.upstream_timeout_seconds
+        ),
+        cache_if=lambda result: result[1] is None
+    )
+
+
+async def _cached_token_pools(address: str) -> Tuple:
+    """The Graph (pools, error) for a token, cached when the query succeeded."""
+    return await _pools_cache.get_or_set(
+        address,
+        lambda: asyncio.wait_for(
+            _get_graph_client().query_token_pools(address),
+            settings.upstream_timeout_seconds
+        ),
+        cache_if=lambda result: result[1] is None
+    )
+
+
+async def _timeout_as_error(lookup, source: str, stamp: str) -> Tuple:
+    """Await a cached (value, error) lookup, turning a blown upstream deadline into a retryable error."""
+    try:
+        return await lookup
+    except asyncio.TimeoutError:
+        return None, _deadline_error(source, stamp)
+
+
+def _deadline_error(source: str, stamp: str) -> StructuredError:
+    return StructuredError(
+        code=ErrorCode.UPSTREAM_TIMEOUT,
+        message=f"{source} did not respond within {settings.upstream_timeout_seconds:g}s",
+        source=source,
+        retryable=True,
+        timestamp=stamp
+    )
+
+
+async def close_clients() -> None:
+    """Close the shared upstream HTTP clients (called on app shutdown)."""
+    for getter in (_get_dex_client, _get_llama_client, _get_graph_client):
+        if getter.cache_info().currsize:
+            await getter().close()
 
 
 @router.post("/liquidity/intel:snapshot", response_model=LiquidityIntelResponse)
@@ -48,80 +170,106 @@ async def analyze_liquidity_intel(request: LiquidityIntelRequest):
     all_warnings: List[str] = []
     evidence_list: List[Evidence] = []
     
+    primary_dex = request.dex[0]
+    
+    # One timestamp for the whole snapshot, shared with errors raised during the fan-out
+    now = datetime.now(timezone.utc)
+    stamp = iso_timestamp(now)
+    
+    # Fan out every upstream call at once so latency tracks the slowest source
+    dex_results, price_result, pools_result = await asyncio.gather(
+        asyncio.gather(
+            *[_analyze_dex_provider(dex_req, stamp) for dex_req in request.dex],
+            return_exceptions=True
+        ),
+        # Optional: DefiLlama price enrichment
+        _timeout_as_error(_cached_token_price(primary_dex.chain_id, primary_dex.token_address), "defillama", stamp),
+        # Optional: The Graph deep pool math
+        _timeout_as_error(_cached_token_pools(primary_dex.token_address), "thegraph", stamp)
+        if request.options.compute_price_impact else _skipped(),
+        return_exceptions=True
+    )
     # Analyze DEX liquidity
     dex_data_list: List[DEXData] = []
     total_dex_liquidity = 0.0
     total_dex_volume = 0.0
+    high_concentration_count = 0
     
-    if request.dex:
-        for dex_req in request.dex:
-            dex_data, dex_errs = await _analyze_dex_provider(dex_req)
-            dex_data_list.append(dex_data)
-            all_errors.extend(dex_errs)
-            
-            # Aggregate for scoring
-            if dex_data.top_pairs:
-                total_dex_liquidity += sum(p.liquidity_usd for p in dex_data.top_pairs)
-                total_dex_volume += sum(p.volume_24h_usd for p in dex_data.top_pairs)
+    for dex_req, result in zip(request.dex, dex_results):
+        if isinstance(result, Exception):
+            dex_data = _failed_dex_data(dex_req)
+            dex_errs = [StructuredError(
+                code=ErrorCode.INTERNAL_ERROR,
+                message=f"Failed to analyze {dex_req.provider} pairs: {str(result)}",
+                source=dex_req.provider,
+                retryable=True,
+                timestamp=stamp
+            )]
+        else:
+            dex_data, dex_errs, concentrated = result
+            high_concentration_count += concentrated
+        
+        dex_data_list.append(dex_data)
+        all_errors.extend(dex_errs)
+        
+        # Aggregate for scoring
+        if dex_data.top_pairs:
+            total_dex_liquidity += sum(p.liquidity_usd for p in dex_data.top_pairs)
+            total_dex_volume += sum(p.volume_24h_usd for p in dex_data.top_pairs)
     
-    # Optional: DefiLlama price enrichment
-    if request.dex and request.dex[0]:
-        llama_client = DefiLlamaClient()
-        price, price_err = await llama_client.get_token_price(
-            request.dex[0].chain_id,
-            request.dex[0].token_address
-        )
+    if isinstance(price_result, Exception):
+        all_warnings.append(f"DefiLlama unavailable: {str(price_result)}")
+    else:
+        price, price_err = price_result
         if price:
             evidence_list.append(Evidence(
                 provider="defillama",
-                timestamp=datetime.now(timezone.utc),
+                timestamp=stamp,
                 note=f"Price reference: ${price:.6f}"
             ))
         elif price_err and price_err.retryable:
             all_warnings.append(f"DefiLlama unavailable: {price_err.message}")
     
-    # Optional: The Graph deep pool math
-    if request.dex and request.options.compute_price_impact:
-        graph_client = TheGraphClient()
-        try:
-            # Query for price impact proxy (if Uniswap V3 pool exists)
-            pools = await graph_client.query_token_pools(
-                request.dex[0].chain_id,
-                request.dex[0].token_address
-            )
-            if pools:
-                evidence_list.append(Evidence(
-                    provider="thegraph",
-                    timestamp=datetime.now(timezone.utc),
-                    note=f"Queried {len(pools)} Uniswap V3 pools for deep math"
-                ))
-        except Exception as e:
-            all_warnings.append(f"The Graph unavailable: {str(e)}")
+    if isinstance(pools_result, Exception):
+        all_warnings.append(f"The Graph unavailable: {str(pools_result)}")
+    elif pools_result is not None:
+        pools, pools_err = pools_result
+        if pools:
+            evidence_list.append(Evidence(
+                provider="thegraph",
+                timestamp=stamp,
+                note=f"Queried {len(pools)} Uniswap V3 pools for deep math"
+            ))
+        elif pools_err:
+            all_warnings.append(f"The Graph unavailable: {pools_err.message}")
     
     # Analyze CEX liquidity
     cex_data_list: List[CEXData] = []
-    if request.cex:
-        for cex_req in request.cex:
-            cex_data = await _analyze_cex_venue(cex_req)
-            cex_data_list.append(cex_data)
-            if cex_data.flags:
-                all_errors.extend([StructuredError(
-                    code=ErrorCode.UNSUPPORTED_SOURCE,
-                    message=f"CEX venue '{cex_req.venue}' not fully implemented",
-                    source=cex_req.venue,
-                    retryable=False
-                ) for flag in cex_data.flags if flag.type == "thin_depth"])
+    has_cex_depth = False
+    for cex_req in request.cex:
+        cex_data = _analyze_cex_venue(cex_req.venue, cex_req.symbol)
+        cex_data_list.append(cex_data)
+        if cex_data.depth.within_10bps_usd is not None:
+            has_cex_depth = True
+        if any(flag.type == "thin_depth" for flag in cex_data.flags):
+            all_errors.append(StructuredError(
+                code=ErrorCode.UNSUPPORTED_SOURCE,
+                message=f"CEX venue '{cex_req.venue}' not fully implemented",
+                source=cex_req.venue,
+                retryable=False,
+                timestamp=stamp
+            ))
     
     # Calculate liquidity score
     liquidity_score = _calculate_liquidity_score(
         total_dex_liquidity,
         total_dex_volume,
-        dex_data_list,
-        cex_data_list
+        high_concentration_count,
+        has_cex_depth
     )
     
-    # Build data section
-    data = LiquidityDataSection(
+    # Build data section (parts are validated models, so skip re-validation)
+    data = LiquidityDataSection.model_construct(
         cex=cex_data_list,
         dex=dex_data_list,
         liquidity_score=liquidity_score
@@ -130,66 +278,72 @@ async def analyze_liquidity_intel(request: LiquidityIntelRequest):
     # Add evidence
     evidence_list.append(Evidence(
         provider="dexscreener",
-        timestamp=datetime.now(timezone.utc),
+        timestamp=stamp,
         note=f"Analyzed {sum(d.pairs_found for d in dex_data_list)} total pairs"
     ))
     
-    return LiquidityIntelResponse(
+    response = LiquidityIntelResponse.model_construct(
         request_id=str(uuid.uuid4()),
-        as_of=datetime.now(timezone.utc).isoformat(),
+        as_of=now.isoformat(),
         data=data,
         evidence=evidence_list,
         warnings=all_warnings,
         errors=all_errors
     )
+    # Parts were validated as they were built; skip FastAPI's response_model round-trip
+    return render(response)
 
 
 # ===== Helper Functions =====
 
-async def _analyze_dex_provider(dex_req) -> Tuple[DEXData, List[StructuredError]]:
+async def _analyze_dex_provider(dex_req, stamp: str) -> Tuple[DEXData, List[StructuredError], bool]:
     """
     Analyze DEX liquidity via Dexscreener.
-    Returns pairs_found, top_pairs, and flags.
+    Returns pairs_found, top_pairs, and flags, plus whether a high
+    concentration flag was raised (so scoring need not re-scan flags).
     """
     errors = []
     
-    dex_client = DexScreenerClient()
-    pairs_data = await dex_client.get_token_pairs(dex_req.chain_id, dex_req.token_address)
+    try:
+        pairs_data = await _cached_token_pairs(dex_req.chain_id, dex_req.token_address)
+    except asyncio.TimeoutError:
+        errors.append(_deadline_error("dexscreener", stamp))
+        return _failed_dex_data(dex_req), errors, False
     
     if pairs_data.get("error"):
         errors.append(StructuredError(
             code=ErrorCode.UPSTREAM_ERROR,
             message=pairs_data["error"],
             source="dexscreener",
-            retryable=True
+            retryable=True,
+            timestamp=stamp
         ))
+        return _failed_dex_data(dex_req), errors, False
+    
+    pairs = pairs_data.get("pairs", [])
+    
+    # Long-tail tokens often have no pairs on the chain at all
+    if not pairs:
         return DEXData(
             provider=dex_req.provider,
             chainId=dex_req.chain_id,
             pairs_found=0,
             top_pairs=[],
-            flags=[LiquidityFlag(
-                type="dex_liquidity_low",
-                severity="high",
-                reason="Failed to fetch DEX data"
-            )]
-        ), errors
-    
-    pairs = pairs_data.get("pairs", [])
+            flags=[_FLAG_DEX_NO_PAIRS]
+        ), errors, False
     
-    # Sort by liquidity
-    sorted_pairs = sorted(
-        pairs,
-        key=lambda p: p.get("liquidity", {}).get("usd", 0),
-        reverse=True
+    # Single pass over the raw pairs: read each pair's liquidity once and keep the top 10
+    ranked = heapq.nlargest(
+        10,
+        (((pair.get("liquidity") or _EMPTY).get("usd") or 0, pair) for pair in pairs),
+        key=itemgetter(0)
     )
     
     # Build top pairs
     top_pairs = []
     total_liquidity = 0.0
-    for pair in sorted_pairs[:10]:
-        liq = pair.get("liquidity", {}).get("usd", 0)
-        vol = pair.get("volume", {}).get("h24", 0)
+    for liq, pair in ranked:
+        vol = (pair.get("volume") or _EMPTY).get("h24") or 0
         price = pair.get("priceUsd")
         fdv = pair.get("fdv")
         
@@ -226,9 +380,11 @@ async def _analyze_dex_provider(dex_req) -> Tuple[DEXData, List[StructuredError]
         ))
     
     # Concentration flag
-    if sorted_pairs and total_liquidity > 0:
-        top_pool_share = sorted_pairs[0].get("liquidity", {}).get("usd", 0) / total_liquidity
+    concentrated = False
+    if ranked and total_liquidity > 0:
+        top_pool_share = ranked[0][0] / total_liquidity
         if top_pool_share > 0.7:
+            concentrated = True
             flags.append(LiquidityFlag(
                 type="liquidity_concentrated",
                 severity="high",
@@ -247,18 +403,38 @@ async def _analyze_dex_provider(dex_req) -> Tuple[DEXData, List[StructuredError]
         pairs_found=len(pairs),
         top_pairs=top_pairs,
         flags=flags
-    ), errors
+    ), errors, concentrated
+
+
+async def _skipped() -> None:
+    """Placeholder for an optional upstream call that is disabled."""
+    return None
+
+
+def _failed_dex_data(dex_req) -> DEXData:
+    """Empty DEX entry for a provider whose data could not be fetched."""
+    return DEXData(
+        provider=dex_req.provider,
+        chainId=dex_req.chain_id,
+        pairs_found=0,
+        top_pairs=[],
+        flags=[_FLAG_DEX_FETCH_FAILED]
+    )
 
 
-async def _analyze_cex_venue(cex_req) -> CEXData:
+@functools.lru_cache(maxsize=32)
+def _analyze_cex_venue(venue: str, symbol: str) -> CEXData:
     """
     Analyze CEX orderbook (placeholder - not fully implemented).
     Returns nulls + flags for unsupported venues.
+    No I/O yet, so the result is built once per (venue, symbol) and shared
+    (CEXData and its parts are frozen, so no response can alter the cached copy);
+    make this async again when a real orderbook fetch lands.
     """
     # CEX integration not fully implemented - return placeholder
     return CEXData(
-        venue=cex_req.venue,
-        symbol=cex_req.symbol,
+        venue=venue,
+        symbol=symbol,
         mid_price=None,
         spread_bps=None,
         depth=CEXDepth(
@@ -270,7 +446,7 @@ async def _analyze_cex_venue(cex_req) -> CEXData:
         flags=[LiquidityFlag(
             type="thin_depth",
             severity="high",
-            reason=f"CEX venue '{cex_req.venue}' not yet implemented"
+            reason=f"CEX venue '{venue}' not yet implemented"
         )]
     )
 
@@ -278,26 +454,30 @@ async def _analyze_cex_venue(cex_req) -> CEXData:
 def _calculate_liquidity_score(
     total_liquidity: float,
     total_volume: float,
-    dex_data_list: List[DEXData],
-    cex_data_list: List[CEXData]
+    concentration_flags: int,
+    has_cex_depth: bool
 ) -> LiquidityScore:
     """
     Calculate deterministic liquidity score (0-1).
     Based on: liquidity level, volume/liquidity ratio, concentration penalty.
+    concentration_flags counts DEX providers flagged as highly concentrated.
     """
-    score = 0.0
+    score = _liquidity_score_kernel(total_liquidity, total_volume, concentration_flags, has_cex_depth)
+    
+    label = _SCORE_LABELS[bisect_right(_SCORE_LABEL_THRESHOLDS, score)]
     
+    return LiquidityScore(score=score, label=label)
+
+
+def _liquidity_score_kernel(
+    total_liquidity: float,
+    total_volume: float,
+    concentration_flags: int,
+    has_cex_depth: bool
+) -> float:
+    """Pure scalar scoring core of _calculate_liquidity_score, clamped to [0, 1]."""
     # Base score from liquidity level
-    if total_liquidity >= 10_000_000:
-        score += 0.5
-    elif total_liquidity >= 1_000_000:
-        score += 0.35
-    elif total_liquidity >= 500_000:
-        score += 0.25
-    elif total_liquidity >= 100_000:
-        score += 0.15
-    else:
-        score += 0.05
+    score = _LIQUIDITY_TIER_SCORES[bisect_right(_LIQUIDITY_TIER_THRESHOLDS, total_liquidity)]
     
     # Volume/liquidity ratio (healthy = 0.5-2.0)
     if total_liquidity > 0:
@@ -308,30 +488,11 @@ def _calculate_liquidity_score(
             score += 0.1
     
     # Concentration penalty
-    concentration_flags = sum(
-        1 for d in dex_data_list 
-        for f in d.flags 
-        if f.type == "liquidity_concentrated" and f.severity == "high"
-    )
-    if concentration_flags == 0:
-        score += 0.15
-    elif concentration_flags == 1:
-        score += 0.05
+    score += _CONCENTRATION_SCORES[min(concentration_flags, len(_CONCENTRATION_SCORES) - 1)]
     
     # CEX depth bonus (if available)
-    has_cex_depth = any(c.depth.within_10bps_usd is not None for c in cex_data_list)
     if has_cex_depth:
         score += 0.15
     
     # Clamp to [0, 1]
-    score = max(0.0, min(1.0, score))
-    
-    # Label
-    if score >= 0.7:
-        label = "high"
-    elif score >= 0.4:
-        label = "medium"
-    else:
-        label = "low"
-    
-    return LiquidityScore(score=score, label=label)
+    return max(0.0, min(1.0, score))
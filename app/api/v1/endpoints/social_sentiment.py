@@ -2,12 +2,18 @@
 Social Sentiment endpoint - /v1/social/sentiment:score
 Multi-source social signal analysis (strict spec compliance).
 """
-from fastapi import APIRouter, HTTPException
-from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from fastapi import APIRouter
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from bisect import bisect_left
+from collections import Counter, defaultdict
+import asyncio
+import functools
 import hashlib
+import heapq
 import uuid
 
+from app.api.v1.rendering import render
 from app.api.v1.schemas.requests import SocialSentimentRequest
 from app.api.v1.schemas.responses import (
     SocialSentimentResponse,
@@ -24,11 +30,56 @@ from app.api.v1.schemas.responses import (
     TopPost,
     Evidence,
     StructuredError,
-    ErrorCode
+    ErrorCode,
+    iso_timestamp
 )
+from app.core.baseline import MentionBaseline
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
 from app.services.cryptopanic_client import CryptoPanicClient
 
 router = APIRouter()
+# Schemas defer their validators; build the request model now rather than on first request
+SocialSentimentRequest.model_rebuild()
+
+# Caps concurrent CryptoPanic requests from this process (the free tier rate-limits hard)
+_cryptopanic_slots = asyncio.Semaphore(16)
+_news_cache = AsyncTTLCache(ttl_seconds=settings.news_cache_ttl_seconds, maxsize=1024)
+
+# Upper bound (inclusive) of each sentiment label; scores above the last are very_positive
+_SENTIMENT_LABEL_THRESHOLDS = (-0.6, -0.2, -0.05, 0.05, 0.2, 0.6)
+_SENTIMENT_LABELS = (
+    "very_negative",
+    "negative",
+    "slightly_negative",
+    "neutral",
+    "slightly_positive",
+    "positive",
+    "very_positive",
+)
+
+# Shared by_source entry for sources without a live integration
+_UNSUPPORTED_SOURCE_SENTIMENT = SourceSentiment(score=None, volume=0, engagement=0, status="unsupported")
+
+
+@functools.lru_cache(maxsize=1)
+def _get_cryptopanic_client() -> CryptoPanicClient:
+    """Return the shared CryptoPanicClient."""
+    return CryptoPanicClient()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_mention_baseline() -> MentionBaseline:
+    """Return the shared Redis-backed mention baseline."""
+    return MentionBaseline(settings.redis_url)
+
+
+async def close_clients() -> None:
+    """Close the shared upstream clients (called on app shutdown)."""
+    if _get_cryptopanic_client.cache_info().currsize:
+        await _get_cryptopanic_client().close()
+    if _get_mention_baseline.cache_info().currsize:
+        await _get_mention_baseline().close()
 
 
 @router.post("/social/sentiment:score", response_model=SocialSentimentResponse)
@@ -55,62 +106,78 @@ async def analyze_social_sentiment(request: SocialSentimentRequest):
     lookback_to = request.lookback.to
     lookback_minutes = (lookback_to - lookback_from).total_seconds() / 60
     
-    # Fetch news from CryptoPanic
+    # Fetch every source with a live integration concurrently
+    live_sources = [source for source in _SOURCE_FETCHERS if source in request.sources]
+    fetched = await asyncio.gather(
+        *[_SOURCE_FETCHERS[source](request) for source in live_sources],
+        return_exceptions=True
+    )
+    source_results = dict(zip(live_sources, fetched))
+    # One timestamp for the whole response, taken once upstream data is in
+    now = datetime.now(timezone.utc)
+    as_of = now.isoformat()
+    stamp = iso_timestamp(now)
+    
+    # News from CryptoPanic
     news_items = []
+    features = _extract_features(news_items, [])
     news_status = "unsupported"
     news_sentiment_score = None
+    vote_coverage = None
     news_volume = 0
+    news_upstream_count = 0
+    news_cache_hit = False
     news_engagement = 0
     
-    if "news" in request.sources:
-        try:
-            client = CryptoPanicClient()
-            lookback_hours = int((lookback_to - lookback_from).total_seconds() / 3600)
-            news_data = await client.get_news(
-                request.asset.symbol,
-                hours=lookback_hours
-            )
-            
-            if news_data.get("error"):
-                all_errors.append(StructuredError(
-                    code=ErrorCode.UPSTREAM_ERROR,
-                    message=news_data["error"],
-                    source="cryptopanic",
-                    retryable=True
-                ))
-                news_status = "partial"
-            else:
-                news_items = news_data["results"][:request.limits.max_items_per_source]
-                news_status = "ok"
-                
-                # Dedupe if requested
-                if request.options.dedupe:
-                    news_items = _dedupe_by_text_hash(news_items)
-                
-                news_volume = len(news_items)
-                news_sentiment_score = _calculate_deterministic_sentiment(news_items)
-                
-                evidence_list.append(Evidence(
-                    provider="cryptopanic",
-                    timestamp=datetime.now(timezone.utc),
-                    ref="https://cryptopanic.com",
-                    note=f"Analyzed {news_volume} news items"
-                ))
-                
-        except Exception as e:
+    if "news" in source_results:
+        news_result = source_results["news"]
+        if isinstance(news_result, Exception):
+            all_errors.append(StructuredError(
+                code=ErrorCode.UPSTREAM_ERROR,
+                message=f"CryptoPanic error: {str(news_result)}",
+                source="cryptopanic",
+                retryable=True,
+                timestamp=stamp
+            ))
+            news_status = "partial"
+        elif news_result[0].get("error"):
             all_errors.append(StructuredError(
                 code=ErrorCode.UPSTREAM_ERROR,
-                message=f"CryptoPanic error: {str(e)}",
+                message=news_result[0]["error"],
                 source="cryptopanic",
-                retryable=True
+                retryable=True,
+                timestamp=stamp
             ))
             news_status = "partial"
+        else:
+            news_data, news_cache_hit = news_result
+            news_upstream_count = len(news_data["results"])
+            news_items = news_data["results"][:request.limits.max_items_per_source]
+            news_status = "ok"
+            
+            # Normalized once; dedupe and the top-post text hashes both read it
+            texts = [_normalize_text(item) for item in news_items]
+            
+            # Dedupe if requested
+            if request.options.dedupe:
+                news_items, texts = _dedupe_by_text_hash(news_items, texts)
+            
+            news_volume = len(news_items)
+            features = _extract_features(news_items, texts)
+            news_sentiment_score, vote_coverage = _score_votes(features)
+            
+            evidence_list.append(Evidence(
+                provider="cryptopanic",
+                timestamp=stamp,
+                ref="https://cryptopanic.com",
+                note=f"Analyzed {news_volume} news items (cache_hit={news_cache_hit})"
+            ))
     
-    # Build by_source sentiment
-    by_source_sentiment = BySourceSentiment()
+    # Build by_source sentiment; sources that weren't requested stay null
+    by_source: Dict[str, SourceSentiment] = {}
     
     if "news" in request.sources:
-        by_source_sentiment.news = SourceSentiment(
+        by_source["news"] = SourceSentiment(
             score=news_sentiment_score,
             volume=news_volume,
             engagement=news_engagement,
@@ -121,132 +188,219 @@ async def analyze_social_sentiment(request: SocialSentimentRequest):
     for source in request.sources:
         source_lower = source.lower()
         if source_lower in ["x", "twitter"]:
-            by_source_sentiment.x = SourceSentiment(
-                score=None,
-                volume=0,
-                engagement=0,
-                status="unsupported"
-            )
+            by_source["x"] = _UNSUPPORTED_SOURCE_SENTIMENT
             all_errors.append(StructuredError(
                 code=ErrorCode.UNSUPPORTED_SOURCE,
                 message=f"Source '{source}' not yet implemented",
                 source=source,
-                retryable=False
+                retryable=False,
+                timestamp=stamp
             ))
         elif source_lower == "reddit":
-            by_source_sentiment.reddit = SourceSentiment(
-                score=None,
-                volume=0,
-                engagement=0,
-                status="unsupported"
-            )
+            by_source["reddit"] = _UNSUPPORTED_SOURCE_SENTIMENT
             all_errors.append(StructuredError(
                 code=ErrorCode.UNSUPPORTED_SOURCE,
                 message=f"Source 'reddit' not yet implemented",
                 source=source,
-                retryable=False
+                retryable=False,
+                timestamp=stamp
             ))
         elif source_lower == "youtube":
-            by_source_sentiment.youtube = SourceSentiment(
-                score=None,
-                volume=0,
-                engagement=0,
-                status="unsupported"
-            )
+            by_source["youtube"] = _UNSUPPORTED_SOURCE_SENTIMENT
             all_errors.append(StructuredError(
                 code=ErrorCode.UNSUPPORTED_SOURCE,
                 message=f"Source 'youtube' not yet implemented",
                 source=source,
-                retryable=False
+                retryable=False,
+                timestamp=stamp
             ))
     
-    # Calculate overall sentiment
-    sentiment_label = _classify_sentiment_label(news_sentiment_score)
-    sentiment_confidence = _calculate_confidence(news_volume, news_items)
-    
-    sentiment = SentimentMetrics(
-        score=news_sentiment_score,
-        label=sentiment_label,
-        confidence=sentiment_confidence,
-        by_source=by_source_sentiment
-    )
-    
-    # Calculate attention metrics
-    mention_velocity = MentionVelocity(
-        per_min=news_volume / lookback_minutes if lookback_minutes > 0 else 0.0,
-        zscore_vs_30d=_calculate_zscore_vs_baseline(news_volume)
-    )
-    
-    unique_authors = _count_unique_authors(news_items)
-    creator_concentration = CreatorConcentration(
-        top_10_share=_calculate_top_10_share(news_items)
-    )
-    
-    attention = AttentionMetrics(
-        mention_velocity=mention_velocity,
-        unique_authors=unique_authors,
-        creator_concentration=creator_concentration
-    )
-    
-    # Calculate influencer pressure
-    top_creators = _extract_top_creators(news_items, limit=5)
-    influencer_score = _calculate_influencer_score(top_creators, news_volume)
-    
-    influencer_pressure = InfluencerPressure(
-        score=influencer_score,
-        top_creators=top_creators
-    )
-    
-    # Detect anomalies
-    anomalies = _detect_anomalies(
-        mention_velocity.zscore_vs_30d,
-        creator_concentration.top_10_share,
-        unique_authors
-    )
-    
-    # Extract top posts
-    top_posts_list = _extract_top_posts(
-        news_items,
-        limit=request.options.return_top_posts
-    )
+    by_source_sentiment = BySourceSentiment.model_construct(**by_source)
+    
+    # The z-score always reads the upstream count per (symbol, lookback window), before
+    # this request's cap and dedupe, so the Redis baseline and the fixed fallback score
+    # the same quantity. Only fresh fetches are recorded, so cache hits don't add copies
+    # and outages don't drag the baseline down.
+    baseline = None
+    if settings.mention_baseline_redis and news_status == "ok":
+        baseline = await _get_mention_baseline().observe(
+            request.asset.symbol, "news", _news_window_hours(request), news_upstream_count, now,
+            record=not news_cache_hit
+        )
+    mention_zscore = _calculate_zscore_vs_baseline(news_upstream_count, baseline)
     
-    # Build data section
-    data = SocialDataSection(
-        sentiment=sentiment,
-        attention=attention,
-        influencer_pressure=influencer_pressure,
-        anomalies=anomalies,
-        top_posts=top_posts_list
-    )
+    if not news_items:
+        # Nothing to score (no live source, upstream failure or an empty window)
+        data = _empty_social_data(by_source_sentiment, mention_zscore)
+    else:
+        # Calculate overall sentiment
+        sentiment_label = _classify_sentiment_label(news_sentiment_score)
+        sentiment_confidence = _calculate_confidence(news_volume, vote_coverage)
+        
+        sentiment = SentimentMetrics(
+            score=news_sentiment_score,
+            label=sentiment_label,
+            confidence=sentiment_confidence,
+            by_source=by_source_sentiment
+        )
+        
+        # Calculate attention metrics
+        mention_velocity = MentionVelocity(
+            per_min=news_volume / lookback_minutes if lookback_minutes > 0 else 0.0,
+            zscore_vs_30d=mention_zscore
+        )
+        
+        unique_authors = _count_unique_authors(features)
+        creator_concentration = CreatorConcentration(
+            top_10_share=_calculate_top_10_share(features)
+        )
+        
+        attention = AttentionMetrics(
+            mention_velocity=mention_velocity,
+            unique_authors=unique_authors,
+            creator_concentration=creator_concentration
+        )
+        
+        # Calculate influencer pressure
+        top_creators = _extract_top_creators(news_items, features, limit=5)
+        influencer_score = _calculate_influencer_score(top_creators, news_volume)
+        
+        influencer_pressure = InfluencerPressure(
+            score=influencer_score,
+            top_creators=top_creators
+        )
+        
+        # Detect anomalies
+        anomalies = _detect_anomalies(
+            mention_velocity.zscore_vs_30d,
+            creator_concentration.top_10_share,
+            unique_authors
+        )
+        
+        # Extract top posts
+        top_posts_list = _extract_top_posts(
+            news_items,
+            features,
+            default_ts=as_of,
+            limit=request.options.return_top_posts
+        )
+        
+        # Build data section (parts are validated models, so skip re-validation)
+        data = SocialDataSection.model_construct(
+            sentiment=sentiment,
+            attention=attention,
+            influencer_pressure=influencer_pressure,
+            anomalies=anomalies,
+            top_posts=top_posts_list
+        )
     
-    # Build response
-    return SocialSentimentResponse(
+    # Build response (parts are validated models, so skip re-validation)
+    response = SocialSentimentResponse.model_construct(
         request_id=str(uuid.uuid4()),
-        as_of=datetime.now(timezone.utc).isoformat(),
+        as_of=as_of,
         data=data,
         evidence=evidence_list,
         warnings=all_warnings,
         errors=all_errors
     )
+    # Parts were validated as they were built; skip FastAPI's response_model round-trip
+    return render(response)
 
 
 # ===== Helper Functions =====
 
-def _dedupe_by_text_hash(items: List[dict]) -> List[dict]:
+def _news_window_hours(request: SocialSentimentRequest) -> int:
+    """Whole hours of lookback; the news cache and mention baseline are keyed by it."""
+    return int((request.lookback.to - request.lookback.from_time).total_seconds() / 3600)
+
+
+async def _fetch_news(request: SocialSentimentRequest) -> Tuple[dict, bool]:
     """
-    Deduplicate items by normalized text hash.
-    Keeps item with max engagement per hash.
+    Fetch CryptoPanic news for the request's lookback window.
+    Returns (news_data, cache_hit); failed fetches are not cached.
+    """
+    symbol = request.asset.symbol.upper()
+    lookback_hours = _news_window_hours(request)
+    fetched = False
+    
+    async def fetch() -> dict:
+        nonlocal fetched
+        fetched = True
+        async with _cryptopanic_slots:
+            return await _get_cryptopanic_client().get_news(symbol, hours=lookback_hours)
+    
+    news_data = await _news_cache.get_or_set(
+        (symbol, lookback_hours),
+        fetch,
+        cache_if=lambda data: not data.get("error")
+    )
+    return news_data, not fetched
+
+
+# Sources with a live integration; the rest are reported as unsupported
+_SOURCE_FETCHERS = {
+    "news": _fetch_news,
+}
+
+
+class _NewsFeatures(NamedTuple):
+    """Per-item vote counts and authorship, as parallel lists aligned with the news items."""
+    positive: List[int]
+    negative: List[int]
+    important: List[int]
+    engagement: List[int]
+    sentiment: List[Optional[float]]   # (positive - negative) / (positive + negative), None without votes
+    authors: List[Optional[str]]   # source title or domain, None if unknown
+    handles: List[Optional[str]]   # creator key (title, domain or "unknown"), None if no source info
+    texts: List[str]   # normalized title + url
+
+
+def _extract_features(items: List[dict], texts: List[str]) -> _NewsFeatures:
+    """
+    Read the votes and source of every item in a single pass so each metric
+    works from plain lists instead of re-walking the nested dicts.
+    texts are the items' normalized texts, in the same order.
     """
-    from collections import defaultdict
+    features = _NewsFeatures([], [], [], [], [], [], [], texts)
+    for item in items:
+        votes = item.get("votes") or {}
+        positive = votes.get("positive", 0)
+        negative = votes.get("negative", 0)
+        features.positive.append(positive)
+        features.negative.append(negative)
+        features.important.append(votes.get("important", 0))
+        features.engagement.append(sum(votes.values()))
+        features.sentiment.append(
+            (positive - negative) / (positive + negative) if positive + negative > 0 else None
+        )
+        
+        source_info = item.get("source", {})
+        if isinstance(source_info, dict):
+            title = source_info.get("title")
+            features.authors.append(title or source_info.get("domain"))
+            features.handles.append(title or source_info.get("domain", "unknown"))
+        else:
+            features.authors.append(None)
+            features.handles.append(None)
     
+    return features
+
+
+def _normalize_text(item: dict) -> str:
+    """Normalized title + url, used to spot duplicates and to hash post text."""
+    return (item.get("title", "") + " " + item.get("url", "")).lower().strip()
+
+
+def _dedupe_by_text_hash(items: List[dict], texts: List[str]) -> Tuple[List[dict], List[str]]:
+    """
+    Deduplicate items by normalized text hash.
+    Keeps item with max engagement per hash; returns the kept items and their texts.
+    """
     hash_to_items = defaultdict(list)
     
-    for item in items:
-        text = item.get("title", "") + " " + item.get("url", "")
-        # Normalize
-        normalized = text.lower().strip()
-        text_hash = hashlib.sha256(normalized.encode()).hexdigest()
-        hash_to_items[text_hash].append(item)
+    for item, normalized in zip(items, texts):
+        # The normalized text is itself the grouping key; no digest needed
+        hash_to_items[normalized].append(item)
     
     deduped = []
     for items_group in hash_to_items.values():
@@ -254,36 +408,36 @@ def _dedupe_by_text_hash(items: List[dict]) -> List[dict]:
         best_item = max(items_group, key=lambda x: x.get("votes", {}).get("positive", 0))
         deduped.append(best_item)
     
-    return deduped
+    return deduped, list(hash_to_items)
 
 
-def _calculate_deterministic_sentiment(items: List[dict]) -> Optional[float]:
+def _score_votes(features: _NewsFeatures) -> Tuple[Optional[float], Optional[float]]:
     """
-    Calculate deterministic sentiment from CryptoPanic votes.
-    Returns -1 to +1, or None if no items.
+    Single pass over the vote counts.
+    Returns (deterministic sentiment -1 to +1, share of items with up/down votes),
+    both None if there are no items.
     """
-    if not items:
-        return None
+    if not features.positive:
+        return None, None
     
     total_score = 0.0
     count = 0
+    items_with_votes = 0
     
-    for item in items:
-        votes = item.get("votes", {})
-        positive = votes.get("positive", 0)
-        negative = votes.get("negative", 0)
-        important = votes.get("important", 0)
-        
+    for positive, negative, important in zip(features.positive, features.negative, features.important):
         # Simple heuristic: positive/important boost, negative reduce
         if positive + negative + important > 0:
             item_score = (positive + important * 0.5 - negative) / (positive + negative + important)
             total_score += item_score
             count += 1
+        if positive + negative > 0:
+            items_with_votes += 1
     
+    vote_coverage = items_with_votes / len(features.positive)
     if count == 0:
-        return 0.0  # Neutral if no vote data
+        return 0.0, vote_coverage  # Neutral if no vote data
     
-    return total_score / count
+    return total_score / count, vote_coverage
 
 
 def _classify_sentiment_label(score: Optional[float]) -> Optional[str]:
@@ -291,25 +445,13 @@ def _classify_sentiment_label(score: Optional[float]) -> Optional[str]:
     if score is None:
         return None
     
-    if score <= -0.6:
-        return "very_negative"
-    elif score <= -0.2:
-        return "negative"
-    elif score <= -0.05:
-        return "slightly_negative"
-    elif score <= 0.05:
-        return "neutral"
-    elif score <= 0.2:
-        return "slightly_positive"
-    elif score <= 0.6:
-        return "positive"
-    else:
-        return "very_positive"
+    return _SENTIMENT_LABELS[bisect_left(_SENTIMENT_LABEL_THRESHOLDS, score)]
 
 
-def _calculate_confidence(volume: int, items: List[dict]) -> float:
+def _calculate_confidence(volume: int, vote_coverage: Optional[float]) -> float:
     """
     Calculate confidence based on sample size and data quality.
+    vote_coverage is the share of items with up/down votes (see _score_votes).
     Returns 0-1.
     """
     if volume == 0:
@@ -319,27 +461,42 @@ def _calculate_confidence(volume: int, items: List[dict]) -> float:
     volume_confidence = min(volume / 50.0, 1.0)  # 50+ items = max confidence
     
     # Agreement factor: check vote consistency
-    if items:
-        vote_counts = [item.get("votes", {}).get("positive", 0) + 
-                      item.get("votes", {}).get("negative", 0) 
-                      for item in items]
-        items_with_votes = sum(1 for vc in vote_counts if vc > 0)
-        vote_confidence = items_with_votes / len(items) if items else 0.5
-    else:
-        vote_confidence = 0.5
+    vote_confidence = vote_coverage if vote_coverage is not None else 0.5
     
     # Combine
     return (volume_confidence * 0.7 + vote_confidence * 0.3)
 
 
-def _calculate_zscore_vs_baseline(current_count: int) -> float:
+def _empty_social_data(by_source: BySourceSentiment, zscore: float) -> SocialDataSection:
+    """Data section for a window without news items: every per-item metric is empty or zero."""
+    return SocialDataSection.model_construct(
+        sentiment=SentimentMetrics(
+            score=None,
+            label=None,
+            confidence=0.0,
+            by_source=by_source
+        ),
+        attention=AttentionMetrics(
+            mention_velocity=MentionVelocity(per_min=0.0, zscore_vs_30d=zscore),
+            unique_authors=None,
+            creator_concentration=CreatorConcentration(top_10_share=0.0)
+        ),
+        influencer_pressure=InfluencerPressure(score=0.0, top_creators=[]),
+        anomalies=[],
+        top_posts=[]
+    )
+
+
+def _calculate_zscore_vs_baseline(
+    current_count: int,
+    baseline: Optional[Tuple[float, float]] = None
+) -> float:
     """
     Calculate z-score vs 30-day baseline.
-    Simplified: assumes baseline mean=10, std=5.
-    Real implementation would maintain rolling stats.
+    baseline is the rolling (mean, std) from Redis; without one, falls back
+    to a fixed baseline of mean=10, std=5.
     """
-    baseline_mean = 10.0
-    baseline_std = 5.0
+    baseline_mean, baseline_std = baseline or (10.0, 5.0)
     
     if baseline_std == 0:
         return 0.0
@@ -348,83 +505,71 @@ def _calculate_zscore_vs_baseline(current_count: int) -> float:
     return zscore
 
 
-def _count_unique_authors(items: List[dict]) -> Optional[int]:
+def _count_unique_authors(features: _NewsFeatures) -> Optional[int]:
     """Count unique authors from news items."""
-    if not items:
-        return None
-    
-    authors = set()
-    for item in items:
-        source_info = item.get("source", {})
-        if isinstance(source_info, dict):
-            author = source_info.get("title") or source_info.get("domain")
-            if author:
-                authors.add(author)
-    
-    return len(authors) if authors else None
+    # Built in C by the set constructor; filter drops unknown (None/empty) authors
+    unique_authors = len(set(filter(None, features.authors)))
+    return unique_authors or None
 
 
-def _calculate_top_10_share(items: List[dict]) -> float:
+def _calculate_top_10_share(features: _NewsFeatures) -> float:
     """
     Calculate what % of content comes from top 10 creators.
     """
-    if not items:
+    if not features.handles:
         return 0.0
     
-    from collections import Counter
-    
     # Count items per author/source
-    author_counts = Counter()
-    for item in items:
-        source_info = item.get("source", {})
-        if isinstance(source_info, dict):
-            author = source_info.get("title") or source_info.get("domain", "unknown")
-            author_counts[author] += 1
+    author_counts = Counter(handle for handle in features.handles if handle is not None)
     
     if not author_counts:
         return 0.0
     
-    # Top 10 share
-    top_10 = author_counts.most_common(10)
-    top_10_count = sum(count for _, count in top_10)
+    # Top 10 share (only the counts matter, not who they belong to)
+    top_10_count = sum(heapq.nlargest(10, author_counts.values()))
     
-    return top_10_count / len(items)
+    return top_10_count / len(features.handles)
+
 
+class _CreatorTotals:
+    """Running engagement and sentiment totals for one creator."""
+    __slots__ = ("engagement", "sentiment_sum", "sentiment_count", "first_post_id")
+    
+    def __init__(self, first_post_id: str):
+        self.engagement = 0
+        self.sentiment_sum = 0.0
+        self.sentiment_count = 0
+        self.first_post_id = first_post_id
 
-def _extract_top_creators(items: List[dict], limit: int = 5) -> List[TopCreator]:
+
+def _extract_top_creators(items: List[dict], features: _NewsFeatures, limit: int = 5) -> List[TopCreator]:
     """Extract top creators/sources by engagement."""
-    from collections import defaultdict
-    
-    creator_data = defaultdict(lambda: {"engagement": 0, "sentiment": [], "posts": []})
-    
-    for item in items:
-        source_info = item.get("source", {})
-        if isinstance(source_info, dict):
-            handle = source_info.get("title") or source_info.get("domain", "unknown")
-            
-            votes = item.get("votes", {})
-            engagement = sum(votes.values())
-            
-            creator_data[handle]["engagement"] += engagement
-            creator_data[handle]["posts"].append(str(item.get("id", "unknown")))
+    creator_data: Dict[str, _CreatorTotals] = {}
+    
+    for i, item in enumerate(items):
+        handle = features.handles[i]
+        if handle is not None:
+            totals = creator_data.get(handle)
+            if totals is None:
+                totals = creator_data[handle] = _CreatorTotals(str(item.get("id", "unknown")))
+            totals.engagement += features.engagement[i]
             
             # Sentiment for this item
-            positive = votes.get("positive", 0)
-            negative = votes.get("negative", 0)
-            if positive + negative > 0:
-                item_sent = (positive - negative) / (positive + negative)
-                creator_data[handle]["sentiment"].append(item_sent)
+            item_sent = features.sentiment[i]
+            if item_sent is not None:
+                totals.sentiment_sum += item_sent
+                totals.sentiment_count += 1
     
     # Convert to TopCreator objects
     top_creators = []
-    for handle, data in sorted(creator_data.items(), key=lambda x: x[1]["engagement"], reverse=True)[:limit]:
-        avg_sentiment = sum(data["sentiment"]) / len(data["sentiment"]) if data["sentiment"] else 0.0
+    for handle, totals in heapq.nlargest(limit, creator_data.items(), key=lambda x: x[1].engagement):
+        avg_sentiment = totals.sentiment_sum / totals.sentiment_count if totals.sentiment_count else 0.0
         top_creators.append(TopCreator(
             handle=handle,
             followers=0,  # Not available from CryptoPanic
-            engagement=data["engagement"],
+            engagement=totals.engagement,
             sentiment=avg_sentiment,
-            post_id=str(data["posts"][0]) if data["posts"] else "unknown",
+            post_id=totals.first_post_id,
             source="news"
         ))
     
@@ -496,45 +641,32 @@ def _detect_anomalies(
     return anomalies
 
 
-def _extract_top_posts(items: List[dict], limit: int = 20) -> List[TopPost]:
-    """Extract top posts by engagement with text hashes."""
+def _extract_top_posts(
+    items: List[dict],
+    features: _NewsFeatures,
+    default_ts: str,
+    limit: int = 20
+) -> List[TopPost]:
+    """Extract top posts by engagement with text hashes. default_ts stands in for a missing published_at."""
     # Sort by engagement (total votes)
-    sorted_items = sorted(
-        items,
-        key=lambda x: sum(x.get("votes", {}).values()),
-        reverse=True
-    )[:limit]
+    sorted_indices = heapq.nlargest(limit, range(len(items)), key=features.engagement.__getitem__)
     
     top_posts = []
-    for item in sorted_items:
-        # Create text hash
-        text = item.get("title", "") + " " + item.get("url", "")
-        normalized = text.lower().strip()
-        text_hash = "sha256:" + hashlib.sha256(normalized.encode()).hexdigest()[:16]
+    for i in sorted_indices:
+        item = items[i]
+        # Create text hash (first 8 digest bytes == first 16 hex chars, without formatting the rest)
+        text_hash = "sha256:" + hashlib.sha256(features.texts[i].encode()).digest()[:8].hex()
         
-        # Calculate sentiment
-        votes = item.get("votes", {})
-        positive = votes.get("positive", 0)
-        negative = votes.get("negative", 0)
-        if positive + negative > 0:
-            sentiment = (positive - negative) / (positive + negative)
-        else:
-            sentiment = 0.0
-        
-        # Extract author
-        source_info = item.get("source", {})
-        author = None
-        if isinstance(source_info, dict):
-            author = source_info.get("title") or source_info.get("domain")
+        sentiment = features.sentiment[i]
         
         top_posts.append(TopPost(
             source="news",
             id=str(item.get("id", "unknown")),
             url=item.get("url", ""),
-            author=author,
-            ts=item.get("published_at", datetime.now(timezone.utc).isoformat()),
-            engagement=sum(votes.values()),
-            sentiment=sentiment,
+            author=features.authors[i],
+            ts=item.get("published_at", default_ts),
+            engagement=features.engagement[i],
+            sentiment=sentiment if sentiment is not None else 0.0,
             text_hash=text_hash
         ))
     
@@ -0,0 +1,14 @@
+"""
+Shared serialization for v1 endpoint responses.
+"""
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def render(response: BaseModel) -> ORJSONResponse:
+    """
+    Serialize a fully built response model straight to an ORJSONResponse.
+    Skips FastAPI's response_model round-trip (dump, re-validate, dump again);
+    pydantic-core produces the JSON-ready dict and orjson encodes it.
+    """
+    return ORJSONResponse(content=response.model_dump(mode="json", by_alias=True))
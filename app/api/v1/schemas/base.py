@@ -0,0 +1,22 @@
+"""
+Shared base model for v1 request and response schemas.
+"""
+from pydantic import BaseModel, ConfigDict
+
+
+class SchemaModel(BaseModel):
+    """
+    Base for every v1 schema.
+    Validators are built on first use instead of at import, so nested types an
+    endpoint never touches cost nothing at startup. Routers rebuild their
+    request models once at import so the first request doesn't pay for it.
+    """
+    model_config = ConfigDict(defer_build=True)
+
+
+class FrozenSchemaModel(SchemaModel):
+    """
+    Base for leaf value objects that never change after construction.
+    Frozen instances are hashable and can be shared safely between responses.
+    """
+    model_config = ConfigDict(frozen=True)
@@ -2,36 +2,45 @@
 Request schemas for v1 API endpoints.
 These match the strict specifications from the audit.
 """
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List
+from pydantic import Field, field_validator
 from datetime import datetime
 
+from app.api.v1.schemas.base import FrozenSchemaModel, SchemaModel
+
 
 # ===== Contract Truth Schemas =====
 
-class TokenInfo(BaseModel):
+class TokenInfo(FrozenSchemaModel):
     """Token metadata."""
     symbol: str = Field(..., min_length=1, max_length=20)
     name: Optional[str] = None
 
 
-class ChainInstance(BaseModel):
+class ChainInstance(FrozenSchemaModel):
     """Single chain instance of a token."""
     chain: str = Field(..., description="Chain name: ethereum, avalanche, solana, bsc, polygon, arbitrum")
     address: str = Field(..., description="Token address on this chain")
     type: str = Field(..., description="Token standard: erc20, spl, erc721, etc.")
+    
+    @field_validator("chain")
+    @classmethod
+    def normalize_chain(cls, v: str) -> str:
+        """Canonicalize chain names once so handlers can compare them directly."""
+        return v.strip().lower()
 
 
-class ContractTruthOptions(BaseModel):
+class ContractTruthOptions(FrozenSchemaModel):
     """Analysis options for contract truth."""
     fetch_verified_source: bool = True
     fetch_abi_or_idl: bool = True
     detect_proxy_or_upgradeability: bool = True
     extract_controls: bool = True
     compute_code_hash: bool = False
+    infer_cross_chain: bool = Field(default=True, description="Set false to skip data.inferred.cross_chain_equivalence")
 
 
-class ContractTruthRequest(BaseModel):
+class ContractTruthRequest(SchemaModel):
     """Request for /v1/contracts/truth:analyze"""
     token: TokenInfo
     instances: List[ChainInstance] = Field(..., min_items=1)
@@ -41,19 +50,19 @@ class ContractTruthRequest(BaseModel):
 
 # ===== Social Signal Schemas =====
 
-class AssetInfo(BaseModel):
+class AssetInfo(FrozenSchemaModel):
     """Asset for social analysis."""
     symbol: str = Field(..., min_length=1, max_length=20)
     name: Optional[str] = None
 
 
-class LookbackWindow(BaseModel):
+class LookbackWindow(FrozenSchemaModel):
     """Time window for social analysis."""
     from_time: datetime = Field(..., alias="from")
     to: datetime
 
 
-class SocialOptions(BaseModel):
+class SocialOptions(FrozenSchemaModel):
     """Options for social analysis."""
     language: List[str] = Field(default=["en"])
     dedupe: bool = True
@@ -61,12 +70,12 @@ class SocialOptions(BaseModel):
     return_top_posts: int = Field(default=20, ge=0, le=100)
 
 
-class SocialLimits(BaseModel):
+class SocialLimits(FrozenSchemaModel):
     """Limits for social data fetching."""
     max_items_per_source: int = Field(default=200, ge=1, le=1000)
 
 
-class SocialSentimentRequest(BaseModel):
+class SocialSentimentRequest(SchemaModel):
     """Request for /v1/social/sentiment:score"""
     asset: AssetInfo
     keywords: List[str] = Field(..., min_items=1)
@@ -78,36 +87,36 @@ class SocialSentimentRequest(BaseModel):
 
 # ===== Liquidity Intel Schemas =====
 
-class LiquidityAsset(BaseModel):
+class LiquidityAsset(FrozenSchemaModel):
     """Asset for liquidity analysis."""
     symbol: str
     coingecko_id: Optional[str] = None
 
 
-class CEXVenue(BaseModel):
+class CEXVenue(FrozenSchemaModel):
     """CEX orderbook request."""
     venue: str = Field(..., description="Exchange name: binance, coinbase, kraken, etc.")
     symbol: str = Field(..., description="Trading pair symbol on exchange")
     depth_levels: List[int] = Field(default=[50, 200, 1000], description="USD depth levels to analyze")
 
 
-class DEXProvider(BaseModel):
+class DEXProvider(FrozenSchemaModel):
     """DEX data request."""
     provider: str = Field(default="dexscreener", description="Data provider: dexscreener, thegraph, defillama")
     chain_id: str = Field(..., alias="chainId", description="Chain identifier")
     token_address: str = Field(..., alias="tokenAddress")
 
 
-class LiquidityOptions(BaseModel):
+class LiquidityOptions(FrozenSchemaModel):
     """Options for liquidity analysis."""
     compute_price_impact: bool = True
     compute_depth_bps: List[int] = Field(default=[10, 25, 50], description="Basis points for depth analysis")
 
 
-class LiquidityIntelRequest(BaseModel):
+class LiquidityIntelRequest(SchemaModel):
     """Request for /v1/liquidity/intel:snapshot"""
     asset: LiquidityAsset
-    cex: List[CEXVenue] = Field(default=[])
+    cex: List[CEXVenue] = Field(default_factory=list)
     dex: List[DEXProvider] = Field(..., min_items=1)
     trade_sizes_usd: List[int] = Field(default=[1000, 10000, 100000])
     options: LiquidityOptions = Field(default_factory=LiquidityOptions)
@@ -2,40 +2,85 @@
 Response schemas for v1 API endpoints.
 Includes structured error handling.
 """
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
-from datetime import datetime
-from enum import Enum
+from typing import Optional, List, Final, Literal, get_args
+from pydantic import Field
+from datetime import datetime, timezone
+import time
 
+from app.api.v1.schemas.base import FrozenSchemaModel, SchemaModel
 
-# ===== Error Handling =====
-
-class ErrorCode(str, Enum):
-    """Standardized error codes."""
-    UPSTREAM_TIMEOUT = "UPSTREAM_TIMEOUT"
-    UPSTREAM_ERROR = "UPSTREAM_ERROR"
-    RATE_LIMITED = "RATE_LIMITED"
-    UNSUPPORTED_SOURCE = "UNSUPPORTED_SOURCE"
-    UNSUPPORTED_CHAIN = "UNSUPPORTED_CHAIN"
-    INVALID_ADDRESS = "INVALID_ADDRESS"
-    MISSING_API_KEY = "MISSING_API_KEY"
-    PARSE_ERROR = "PARSE_ERROR"
-    INTERNAL_ERROR = "INTERNAL_ERROR"
 
+# ===== Error Handling =====
 
-class StructuredError(BaseModel):
+def iso_timestamp(moment: datetime) -> str:
+    """ISO-8601 text for Evidence/StructuredError timestamps, with UTC written as Z."""
+    text = moment.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+_error_clock = [-1, ""]   # [epoch second, ISO text for that second]
+
+
+def _error_timestamp() -> str:
+    """
+    Current UTC time at one-second resolution, for errors raised outside a handler's
+    response timestamp. Formatted once per second and shared by every error in it.
+    """
+    second = int(time.time())
+    if second != _error_clock[0]:
+        _error_clock[0] = second
+        _error_clock[1] = iso_timestamp(datetime.fromtimestamp(second, timezone.utc))
+    return _error_clock[1]
+
+
+class ErrorCode:
+    """
+    Standardized error codes.
+    Plain string constants: StructuredError validates them as a Literal,
+    which is a set lookup rather than an Enum conversion.
+    """
+    UPSTREAM_TIMEOUT: Final = "UPSTREAM_TIMEOUT"
+    UPSTREAM_ERROR: Final = "UPSTREAM_ERROR"
+    RATE_LIMITED: Final = "RATE_LIMITED"
+    UNSUPPORTED_SOURCE: Final = "UNSUPPORTED_SOURCE"
+    UNSUPPORTED_CHAIN: Final = "UNSUPPORTED_CHAIN"
+    INVALID_ADDRESS: Final = "INVALID_ADDRESS"
+    MISSING_API_KEY: Final = "MISSING_API_KEY"
+    PARSE_ERROR: Final = "PARSE_ERROR"
+    INTERNAL_ERROR: Final = "INTERNAL_ERROR"
+
+
+ErrorCodeValue = Literal[
+    "UPSTREAM_TIMEOUT",
+    "UPSTREAM_ERROR",
+    "RATE_LIMITED",
+    "UNSUPPORTED_SOURCE",
+    "UNSUPPORTED_CHAIN",
+    "INVALID_ADDRESS",
+    "MISSING_API_KEY",
+    "PARSE_ERROR",
+    "INTERNAL_ERROR",
+]
+
+# Fail at import if a code is added to one list but not the other
+assert set(get_args(ErrorCodeValue)) == {
+    value for name, value in vars(ErrorCode).items() if not name.startswith("_")
+}, "ErrorCode and ErrorCodeValue list different codes"
+
+
+class StructuredError(SchemaModel):
     """Structured error for partial failures."""
-    code: ErrorCode
+    code: ErrorCodeValue
     message: str
     source: Optional[str] = Field(None, description="Which provider/service failed")
     retryable: bool = Field(False, description="Whether client should retry")
-    timestamp: datetime = Field(default_factory=lambda: datetime.now())
+    timestamp: str = Field(default_factory=_error_timestamp, description="ISO-8601 timestamp")
 
 
-class Evidence(BaseModel):
+class Evidence(SchemaModel):
     """Evidence for a data point or decision."""
     provider: str = Field(..., description="Data source: etherscan, cryptopanic, dexscreener, etc.")
-    timestamp: datetime
+    timestamp: str = Field(..., description="ISO-8601 timestamp")
     request_hash: Optional[str] = Field(None, description="Hash of request for deduplication")
     ref: Optional[str] = Field(None, description="URL or reference to raw data")
     note: Optional[str] = Field(None, description="Human-readable note")
@@ -44,7 +89,7 @@ class Evidence(BaseModel):
 # ===== Contract Truth Response (Strict Spec) =====
 
 # Verification data
-class VerificationData(BaseModel):
+class VerificationData(FrozenSchemaModel):
     """Contract verification information."""
     verified_source: bool
     explorer: str = Field(..., description="etherscan|snowtrace|solscan|other")
@@ -53,7 +98,7 @@ class VerificationData(BaseModel):
 
 
 # Code identity
-class CodeIdentity(BaseModel):
+class CodeIdentity(FrozenSchemaModel):
     """Code identity information."""
     runtime_code_hash: Optional[str] = Field(None, description="keccak256:...")
     deployer: Optional[str] = None
@@ -61,7 +106,7 @@ class CodeIdentity(BaseModel):
 
 
 # Upgradeability data
-class UpgradeabilityData(BaseModel):
+class UpgradeabilityData(FrozenSchemaModel):
     """Proxy and upgradeability information."""
     is_proxy: bool
     proxy_type: Optional[str] = Field(None, description="uups|transparent|beacon|unknown|null")
@@ -73,14 +118,14 @@ class UpgradeabilityData(BaseModel):
 
 
 # Fee controls
-class FeeControls(BaseModel):
+class FeeControls(FrozenSchemaModel):
     """Fee control capabilities."""
     can_change_fees: bool
     max_fee_bps: Optional[int] = None
 
 
 # Controls data
-class ControlsData(BaseModel):
+class ControlsData(FrozenSchemaModel):
     """Token control capabilities."""
     owner_or_admin: Optional[str] = None
     can_mint: Optional[bool] = None
@@ -91,7 +136,7 @@ class ControlsData(BaseModel):
 
 
 # Supply activity
-class SupplyActivity(BaseModel):
+class SupplyActivity(FrozenSchemaModel):
     """Supply activity metrics."""
     mint_events_lookback: Optional[int] = None
     mint_amount_lookback: Optional[str] = None
@@ -100,15 +145,16 @@ class SupplyActivity(BaseModel):
 
 
 # Risk flag
-class RiskFlag(BaseModel):
+class RiskFlag(FrozenSchemaModel):
     """Risk flag."""
+    
     id: str = Field(..., description="MINT_PRIVILEGE|PROXY_UPGRADEABLE|UPGRADEABLE_NO_TIMELOCK_EVIDENCE|FREEZE_AUTHORITY_PRESENT|UPGRADE_AUTHORITY_PRESENT")
     severity: str = Field(..., description="low|medium|high")
     why: str
 
 
 # Instance data (PROVEN)
-class ProvenInstance(BaseModel):
+class ProvenInstance(SchemaModel):
     """Proven facts about a chain instance."""
     chain: str
     address: str
@@ -118,11 +164,11 @@ class ProvenInstance(BaseModel):
     upgradeability: UpgradeabilityData
     controls: ControlsData
     supply_activity: SupplyActivity
-    risk_flags: List[RiskFlag] = Field(default=[])
+    risk_flags: List[RiskFlag] = Field(default_factory=list)
 
 
 # Cross-chain equivalence (INFERRED)
-class CrossChainEquivalence(BaseModel):
+class CrossChainEquivalence(FrozenSchemaModel):
     """Cross-chain asset equivalence analysis."""
     pair: List[str] = Field(..., description="['chain:address', 'chain:address']")
     confidence: float = Field(..., ge=0, le=1)
@@ -131,39 +177,45 @@ class CrossChainEquivalence(BaseModel):
 
 
 # Proven section
-class ProvenSection(BaseModel):
+class ProvenSection(SchemaModel):
     """Proven facts section."""
     instances: List[ProvenInstance]
 
 
 # Inferred section
-class InferredSection(BaseModel):
+class InferredSection(SchemaModel):
     """Inferred analysis section."""
-    cross_chain_equivalence: List[CrossChainEquivalence] = Field(default=[])
+    cross_chain_equivalence: List[CrossChainEquivalence] = Field(default_factory=list)
 
 
 # Data section wrapper
-class ContractTruthDataSection(BaseModel):
-    """Data section with PROVEN vs INFERRED separation."""
+class ContractTruthDataSection(SchemaModel):
+    """
+    Data section with PROVEN vs INFERRED separation.
+    Assembled with model_construct from validated parts; not re-validated.
+    """
     proven: ProvenSection
     inferred: InferredSection
 
 
 # Strict spec response
-class ContractTruthResponse(BaseModel):
-    """Response for /v1/contracts/truth:analyze (strict spec)."""
+class ContractTruthResponse(SchemaModel):
+    """
+    Response for /v1/contracts/truth:analyze (strict spec).
+    Assembled with model_construct from validated parts; not re-validated.
+    """
     request_id: str
     as_of: str = Field(..., description="ISO timestamp")
     data: ContractTruthDataSection
-    evidence: List[Evidence] = Field(default=[])
-    warnings: List[str] = Field(default=[])
-    errors: List[StructuredError] = Field(default=[])
+    evidence: List[Evidence] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
+    errors: List[StructuredError] = Field(default_factory=list)
 
 
 # ===== Social Signal Response =====
 
 # Source-level sentiment
-class SourceSentiment(BaseModel):
+class SourceSentiment(FrozenSchemaModel):
     """Sentiment for a single source."""
     score: Optional[float] = Field(None, ge=-1, le=1)
     volume: int = Field(..., ge=0)
@@ -171,7 +223,7 @@ class SourceSentiment(BaseModel):
     status: str = Field(..., description="ok|partial|unsupported")
 
 
-class BySourceSentiment(BaseModel):
+class BySourceSentiment(SchemaModel):
     """Sentiment breakdown by source."""
     news: Optional[SourceSentiment] = None
     x: Optional[SourceSentiment] = None
@@ -180,20 +232,20 @@ class BySourceSentiment(BaseModel):
 
 
 # Mention velocity
-class MentionVelocity(BaseModel):
+class MentionVelocity(FrozenSchemaModel):
     """Mention velocity with baseline comparison."""
     per_min: float = Field(..., ge=0)
     zscore_vs_30d: float
 
 
 # Creator concentration
-class CreatorConcentration(BaseModel):
+class CreatorConcentration(FrozenSchemaModel):
     """Top creator concentration metric."""
     top_10_share: float = Field(..., ge=0, le=1)
 
 
 # Top creator/influencer
-class TopCreator(BaseModel):
+class TopCreator(FrozenSchemaModel):
     """Top influencer information."""
     handle: str
     followers: int = Field(default=0, ge=0)
@@ -204,7 +256,7 @@ class TopCreator(BaseModel):
 
 
 # Anomaly detection
-class Anomaly(BaseModel):
+class Anomaly(FrozenSchemaModel):
     """Detected anomaly."""
     type: str = Field(..., description="volume_spike|coordination_signal")
     severity: str = Field(..., description="low|medium|high")
@@ -212,7 +264,7 @@ class Anomaly(BaseModel):
 
 
 # Top post with text hash
-class TopPost(BaseModel):
+class TopPost(SchemaModel):
     """Top post with deduplication hash."""
     source: str
     id: str
@@ -225,7 +277,7 @@ class TopPost(BaseModel):
 
 
 # Main metrics
-class SentimentMetrics(BaseModel):
+class SentimentMetrics(SchemaModel):
     """Sentiment analysis metrics."""
     score: Optional[float] = Field(None, ge=-1, le=1, description="Overall sentiment: -1=negative, +1=positive")
     label: Optional[str] = Field(None, description="very_negative|negative|slightly_negative|neutral|slightly_positive|positive|very_positive")
@@ -233,70 +285,55 @@ class SentimentMetrics(BaseModel):
     by_source: BySourceSentiment
 
 
-class AttentionMetrics(BaseModel):
+class AttentionMetrics(SchemaModel):
     """Attention and velocity metrics."""
     mention_velocity: MentionVelocity
     unique_authors: Optional[int] = Field(None, ge=0)
     creator_concentration: CreatorConcentration
 
 
-class InfluencerPressure(BaseModel):
+class InfluencerPressure(SchemaModel):
     """Influencer pressure metrics."""
     score: float = Field(..., ge=0, le=1)
-    top_creators: List[TopCreator] = Field(default=[])
-
-
-# Legacy schemas for compatibility
-class SourceBreakdown(BaseModel):
-    """Per-source analysis (legacy)."""
-    source: str
-    item_count: int
-    sentiment_avg: Optional[float] = Field(None, ge=-1, le=1)
-    top_keywords: List[str] = Field(default=[])
-    errors: List[StructuredError] = Field(default=[])
-
-
-class CoordinationMetrics(BaseModel):
-    """Coordination detection metrics (legacy)."""
-    source_diversity_score: float = Field(..., ge=0, le=1)
-    unique_sources: int
-    total_sources: int
-    suspected_coordination: bool
-    evidence: List[str] = Field(default=[])
+    top_creators: List[TopCreator] = Field(default_factory=list)
 
 
 # Data section wrapper
-class SocialDataSection(BaseModel):
+class SocialDataSection(SchemaModel):
     """Data section for strict spec compliance."""
     sentiment: SentimentMetrics
     attention: AttentionMetrics
     influencer_pressure: InfluencerPressure
-    anomalies: List[Anomaly] = Field(default=[])
-    top_posts: List[TopPost] = Field(default=[])
+    anomalies: List[Anomaly] = Field(default_factory=list)
+    top_posts: List[TopPost] = Field(default_factory=list)
 
 
-class SocialSentimentResponse(BaseModel):
-    """Response for /v1/social/sentiment:score (strict spec)."""
+class SocialSentimentResponse(SchemaModel):
+    """
+    Response for /v1/social/sentiment:score (strict spec).
+    Assembled with model_construct from validated parts; not re-validated.
+    """
     request_id: str
     as_of: str = Field(..., description="ISO timestamp")
     data: SocialDataSection
-    evidence: List[Evidence] = Field(default=[])
-    warnings: List[str] = Field(default=[])
-    errors: List[StructuredError] = Field(default=[])
+    evidence: List[Evidence] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
+    errors: List[StructuredError] = Field(default_factory=list)
 
 
 # ===== Liquidity Intel Response =====
 
 # Liquidity flags
-class LiquidityFlag(BaseModel):
+class LiquidityFlag(FrozenSchemaModel):
     """Liquidity risk flag."""
+    
     type: str = Field(..., description="thin_depth|gap_risk|dex_liquidity_low|liquidity_concentrated")
     severity: str = Field(..., description="low|medium|high")
     reason: str
 
 
 # Top pair/pool data
-class TopPair(BaseModel):
+class TopPair(FrozenSchemaModel):
     """Top DEX pair."""
     pair: str
     price_usd: float
@@ -306,17 +343,17 @@ class TopPair(BaseModel):
 
 
 # DEX data (strict spec)
-class DEXData(BaseModel):
+class DEXData(SchemaModel):
     """DEX liquidity data."""
     provider: str
     chainId: str
     pairs_found: int
-    top_pairs: List[TopPair] = Field(default=[])
-    flags: List[LiquidityFlag] = Field(default=[])
+    top_pairs: List[TopPair] = Field(default_factory=list)
+    flags: List[LiquidityFlag] = Field(default_factory=list)
 
 
 # CEX depth data
-class CEXDepth(BaseModel):
+class CEXDepth(FrozenSchemaModel):
     """CEX orderbook depth."""
     within_10bps_usd: Optional[float] = None
     within_25bps_usd: Optional[float] = None
@@ -324,45 +361,48 @@ class CEXDepth(BaseModel):
 
 
 # CEX impact estimate
-class ImpactEstimate(BaseModel):
+class ImpactEstimate(FrozenSchemaModel):
     """CEX slippage estimate."""
     size_usd: int
     slippage_bps: float
 
 
 # CEX data (strict spec)
-class CEXData(BaseModel):
-    """CEX orderbook data."""
+class CEXData(FrozenSchemaModel):
+    """CEX orderbook data. Frozen: placeholder entries are cached and shared across responses."""
     venue: str
     symbol: str
     mid_price: Optional[float] = None
     spread_bps: Optional[float] = None
     depth: CEXDepth
-    impact_estimates: List[ImpactEstimate] = Field(default=[])
-    flags: List[LiquidityFlag] = Field(default=[])
+    impact_estimates: List[ImpactEstimate] = Field(default_factory=list)
+    flags: List[LiquidityFlag] = Field(default_factory=list)
 
 
 # Liquidity score
-class LiquidityScore(BaseModel):
+class LiquidityScore(FrozenSchemaModel):
     """Overall liquidity score."""
     score: float = Field(..., ge=0, le=1)
     label: str = Field(..., description="low|medium|high")
 
 
 # Data section wrapper
-class LiquidityDataSection(BaseModel):
+class LiquidityDataSection(SchemaModel):
     """Data section for strict spec compliance."""
-    cex: List[CEXData] = Field(default=[])
-    dex: List[DEXData] = Field(default=[])
+    cex: List[CEXData] = Field(default_factory=list)
+    dex: List[DEXData] = Field(default_factory=list)
     liquidity_score: LiquidityScore
 
 
 # Strict spec response
-class LiquidityIntelResponse(BaseModel):
-    """Response for /v1/liquidity/intel:snapshot (strict spec)."""
+class LiquidityIntelResponse(SchemaModel):
+    """
+    Response for /v1/liquidity/intel:snapshot (strict spec).
+    Assembled with model_construct from validated parts; not re-validated.
+    """
     request_id: str
     as_of: str = Field(..., description="ISO timestamp")
     data: LiquidityDataSection
-    evidence: List[Evidence] = Field(default=[])
-    warnings: List[str] = Field(default=[])
-    errors: List[StructuredError] = Field(default=[])
+    evidence: List[Evidence] = Field(default_factory=list)
+    warnings: List[str] = Field(default_factory=list)
+    errors: List[StructuredError] = Field(default_factory=list)
@@ -0,0 +1,83 @@
+"""
+Rolling 30-day mention baseline backed by Redis.
+Each (symbol, source, lookback window) keeps one hash per UTC day with the
+observation count, sum and sum of squares, so updates are atomic HINCRBYs and
+the window mean/std is recombined from at most 30 buckets. Counts from
+different lookback windows are never mixed.
+"""
+import math
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+
+class MentionBaseline:
+    """Per-(symbol, source, window) rolling mean/std of mention counts."""
+
+    WINDOW_DAYS = 30
+    # Below this many observations the window is too thin to trust
+    MIN_SAMPLES = 5
+
+    def __init__(self, redis_url: str, timeout: float = 0.5):
+        self._redis = aioredis.from_url(
+            redis_url,
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout
+        )
+
+    async def observe(
+        self,
+        symbol: str,
+        source: str,
+        window_hours: int,
+        count: int,
+        now: datetime,
+        record: bool = True
+    ) -> Optional[Tuple[float, float]]:
+        """
+        Return the (mean, std) of counts seen over the last 30 days for this
+        lookback window, then record count unless record is False.
+        Pass record=False when count was already observed (e.g. served from cache).
+        Returns None when Redis is unavailable or the window has too few samples.
+        """
+        prefix = f"mention_baseline:{symbol.upper()}:{source}:{window_hours}h:"
+        days = [
+            (now - timedelta(days=offset)).strftime("%Y%m%d")
+            for offset in range(self.WINDOW_DAYS)
+        ]
+        today_key = prefix + days[0]
+
+        pipe = self._redis.pipeline(transaction=False)
+        # Read the window before adding this observation so it isn't scored against itself
+        for day in days:
+            pipe.hmget(prefix + day, "n", "sum", "sumsq")
+        if record:
+            pipe.hincrby(today_key, "n", 1)
+            pipe.hincrby(today_key, "sum", count)
+            pipe.hincrby(today_key, "sumsq", count * count)
+            pipe.expire(today_key, timedelta(days=self.WINDOW_DAYS + 1))
+
+        try:
+            results = await pipe.execute()
+        except (RedisError, OSError):
+            return None
+
+        n = total = total_sq = 0
+        for bucket_n, bucket_sum, bucket_sumsq in results[:self.WINDOW_DAYS]:
+            if bucket_n is not None:
+                n += int(bucket_n)
+                total += int(bucket_sum or 0)
+                total_sq += int(bucket_sumsq or 0)
+
+        if n < self.MIN_SAMPLES:
+            return None
+
+        mean = total / n
+        variance = max(total_sq - total * total / n, 0.0) / (n - 1)
+        return mean, math.sqrt(variance)
+
+    async def close(self) -> None:
+        """Release pooled Redis connections."""
+        await self._redis.aclose()
@@ -0,0 +1,71 @@
+"""
+In-memory TTL cache for async lookups.
+Concurrent misses for the same key are coalesced so the upstream is hit once.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class AsyncTTLCache:
+    """Process-local cache with per-entry expiry and a lock per key."""
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+        # Tasks holding or queued on each key's lock; the lock is dropped when this reaches zero
+        self._waiters: Dict[Hashable, int] = {}
+
+    async def get_or_set(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        cache_if: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the cached value for key, or await factory() and cache its result.
+        Exceptions from factory propagate and are not cached; neither are
+        results rejected by cache_if.
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                # Another waiter may have filled the entry while we queued
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    return entry[1]
+
+                value = await factory()
+                if cache_if is None or cache_if(value):
+                    self._store(key, value)
+                return value
+        finally:
+            remaining = self._waiters[key] - 1
+            if remaining:
+                self._waiters[key] = remaining
+            else:
+                del self._waiters[key]
+                del self._locks[key]
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        now = time.monotonic()
+        if len(self._entries) >= self.maxsize:
+            # Drop expired entries first, then the oldest insertions
+            for stale_key in [k for k, (expires, _) in self._entries.items() if expires <= now]:
+                del self._entries[stale_key]
+            while len(self._entries) >= self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+        self._entries.pop(key, None)
+        self._entries[key] = (now + self.ttl_seconds, value)
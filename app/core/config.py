@@ -2,6 +2,9 @@
 Configuration management using Pydantic settings.
 Loads from environment variables with validation.
 """
+import functools
+
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Dict
 
@@ -21,6 +24,14 @@ class Settings(BaseSettings):
     bsc_rpc_url: str = "https://bsc-dataseed.binance.org/"
     polygon_rpc_url: str = "https://polygon-rpc.com/"
     solana_rpc_url: str = "https://api.mainnet-beta.solana.com"  # Can use Helius for production
+    # Send independent EVM reads as one JSON-RPC batch. Off by default: some
+    # providers bill every batch member against the rate limit.
+    rpc_batch_requests: bool = False
+    # Pack each EVM contract analysis's eth_calls into one Multicall3 aggregate3 call
+    # (falls back to individual calls where the batch fails)
+    rpc_multicall: bool = True
+    # Overall deadline for each market-data upstream call (Dexscreener, DefiLlama, The Graph)
+    upstream_timeout_seconds: float = 5.0
     
     # Service URLs
     dexscreener_base_url: str = "https://api.dexscreener.com/latest"
@@ -31,6 +42,14 @@ class Settings(BaseSettings):
     # Cache settings
     redis_url: str = "redis://localhost:6379"
     cache_ttl_seconds: int = 300
+    # Market data goes stale faster than contract facts
+    dex_pairs_cache_ttl_seconds: int = 60
+    price_cache_ttl_seconds: int = 300
+    pools_cache_ttl_seconds: int = 120
+    news_cache_ttl_seconds: int = 60
+    # Score mention velocity against a rolling 30-day baseline kept in Redis
+    # (falls back to the fixed baseline when Redis is unreachable)
+    mention_baseline_redis: bool = False
     
     # App settings
     app_name: str = "Token Due Diligence Engine"
@@ -43,24 +62,36 @@ class Settings(BaseSettings):
         case_sensitive=False
     )
     
-    def get_explorer_api_key(self, chain: str) -> str:
-        """Get the appropriate block explorer API key for a chain."""
-        mapping = {
+    # Per-chain lookup tables, built once after the settings load
+    _explorer_keys: Dict[str, str] = PrivateAttr(default_factory=dict)
+    _rpc_urls: Dict[str, str] = PrivateAttr(default_factory=dict)
+    
+    def model_post_init(self, __context) -> None:
+        self._explorer_keys = {
             "ethereum": self.etherscan_api_key,
             "bsc": self.bscscan_api_key,
             "polygon": self.polygonscan_api_key,
         }
-        return mapping.get(chain.lower(), "")
-    
-    def get_rpc_url(self, chain: str) -> str:
-        """Get RPC endpoint for a chain."""
-        mapping = {
+        self._rpc_urls = {
             "ethereum": self.ethereum_rpc_url,
             "bsc": self.bsc_rpc_url,
             "polygon": self.polygon_rpc_url,
             "solana": self.solana_rpc_url,
         }
-        return mapping.get(chain.lower(), "")
+    
+    def get_explorer_api_key(self, chain: str) -> str:
+        """Get the appropriate block explorer API key for a chain."""
+        return self._explorer_keys.get(chain if chain.islower() else chain.lower(), "")
+    
+    def get_rpc_url(self, chain: str) -> str:
+        """Get RPC endpoint for a chain."""
+        return self._rpc_urls.get(chain if chain.islower() else chain.lower(), "")
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings, reading the environment only once."""
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
@@ -41,6 +41,27 @@ class RiskFlag(str, Enum):
     NO_SOCIAL_DATA = "NO_SOCIAL_DATA"
 
 
+# Severity of each flag (1=low, 10=critical); feeds the 0-100 risk scores
+RISK_SEVERITY = {
+    RiskFlag.MINTABLE: 6,
+    RiskFlag.BURNABLE: 3,
+    RiskFlag.PAUSABLE: 7,
+    RiskFlag.FREEZABLE: 8,
+    RiskFlag.UPGRADEABLE_PROXY: 7,
+    RiskFlag.UNVERIFIED_CONTRACT: 8,
+    RiskFlag.OWNERSHIP_NOT_RENOUNCED: 5,
+    RiskFlag.LOW_LIQUIDITY: 9,
+    RiskFlag.LOW_VOLUME: 7,
+    RiskFlag.HIGH_SLIPPAGE: 8,
+    RiskFlag.CONCENTRATED_POOLS: 6,
+    RiskFlag.NO_CEX_SUPPORT: 6,
+    RiskFlag.NEGATIVE_SENTIMENT: 6,
+    RiskFlag.LOW_ATTENTION: 4,
+    RiskFlag.COORDINATED_NARRATIVE: 5,
+    RiskFlag.NO_SOCIAL_DATA: 3,
+}
+
+
 class DecisionHint(str, Enum):
     """Final recommendation for listing team."""
     LIST = "LIST"                           # Safe to list with standard parameters
@@ -62,6 +62,9 @@ class ContractTruthResponse(BaseModel):
     # Risk summary
     risk_flags: List[RiskFlagDetail]
     contract_risk_score: int = Field(..., ge=0, le=100)  # 0=safe, 100=critical
+    
+    # Upstream lookups (explorer/RPC) that failed; fields read from them fell back to defaults
+    upstream_errors: List[str] = Field(default_factory=list)
 
 
 class SocialIntelResponse(BaseModel):
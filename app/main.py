@@ -3,11 +3,13 @@ FastAPI application main entry point.
 Defines all endpoints for the Token Due Diligence Decision Engine.
 """
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 
 # Import V1 API router
 from app.api.v1.api import api_router as api_v1_router
+from app.api.v1.endpoints import contract_truth, liquidity_intel, social_sentiment
 
 
 # Initialize FastAPI app
@@ -16,7 +18,8 @@ app = FastAPI(
     version="1.0.0",
     description="A truth machine for crypto token due diligence. Returns facts, signals, and explicit uncertainty.",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware (adjust origins for production)
@@ -32,10 +35,18 @@ app.add_middleware(
 app.include_router(api_v1_router, prefix="/v1")
 
 
+@app.on_event("shutdown")
+async def close_upstream_clients():
+    """Release pooled upstream connections."""
+    await contract_truth.close_clients()
+    await liquidity_intel.close_clients()
+    await social_sentiment.close_clients()
+
+
 @app.get("/")
 async def root():
     """Health check and API info."""
-    return {
+    return ORJSONResponse(content={
         "status": "operational",
         "service": settings.app_name,
         "version": "1.0.0",
@@ -45,13 +56,13 @@ async def root():
             "social_sentiment": "POST /v1/social/sentiment:score",
             "liquidity_intel": "POST /v1/liquidity/intel:snapshot"
         }
-    }
+    })
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint for monitoring."""
-    return {"status": "healthy", "service": settings.app_name}
+    return ORJSONResponse(content={"status": "healthy", "service": settings.app_name})
 
 
 if __name__ == "__main__":
@@ -3,10 +3,25 @@ Contract analysis utilities.
 Detects proxy patterns, admin functions, and ownership structures.
 """
 from typing import Optional, Dict, List, Tuple
-from web3 import Web3
+import asyncio
+from web3 import AsyncWeb3
 from eth_utils import is_address, to_checksum_address
 import re
 
+from app.services.multicall import PrefetchedCalls, calldata
+
+# Admin-function patterns, one alternation per capability so each source scan is a single pass
+_MINT_RE = re.compile(r'\bfunction\s+_?mint\s*\(', re.IGNORECASE)
+_BURN_RE = re.compile(r'\bfunction\s+(?:_?burn|burnFrom)\s*\(', re.IGNORECASE)
+_PAUSE_RE = re.compile(r'\bfunction\s+pause\s*\(|\bwhenNotPaused\b', re.IGNORECASE)
+_FREEZE_RE = re.compile(r'\bfunction\s+(?:freeze|blacklist)\s*\(|\bfreeze.*Account\b', re.IGNORECASE)
+
+# Calldata for the fixed reads, hashed once at import
+_IMPLEMENTATION_CALL = calldata("implementation()")
+_OWNER_CALL = calldata("owner()")
+
+_ZERO_ADDRESS = bytes(20)
+
 
 class ContractAnalyzer:
     """Analyzes smart contract bytecode and source code for risk patterns."""
@@ -29,55 +44,111 @@ class ContractAnalyzer:
         "upgrade": ["upgradeTo(address)", "upgradeToAndCall(address,bytes)"],
     }
     
-    def __init__(self, web3: Web3):
+    # Storage slots as ints, parsed once
+    EIP1967_SLOT = int(PROXY_PATTERNS["EIP-1967"], 16)
+    EIP1822_SLOT = int(PROXY_PATTERNS["EIP-1822"], 16)
+    
+    # Functions probed (in order) to decide whether a proxy is upgradeable, with their calldata
+    UPGRADE_PROBES = [
+        (sig, calldata(sig, 1))
+        for sig in (
+            f"{func_name}({args})"
+            for func_name in ("upgradeTo", "upgradeToAndCall", "setImplementation")
+            for args in ("address", "address,bytes")
+        )
+    ]
+    
+    def __init__(self, web3: AsyncWeb3):
         self.web3 = web3
+        # Sends every read straight to the node; used when nothing was prefetched
+        self._direct_calls = PrefetchedCalls(web3)
+    
+    def batch_calls(self, address: str) -> List[Tuple[str, str]]:
+        """
+        Every eth_call the analysis of address may make, as (target, calldata),
+        so they can be prefetched in one multicall.
+        """
+        return [
+            (address, _IMPLEMENTATION_CALL),
+            *[(address, probe_call) for _, probe_call in self.UPGRADE_PROBES],
+            (address, _OWNER_CALL),
+        ]
     
-    def detect_proxy(self, address: str) -> Tuple[bool, Optional[str], str]:
+    async def read_proxy_slots(self, address: str) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """
+        Read the EIP-1967 and EIP-1822 implementation slots concurrently.
+        Returns: (eip1967_storage, eip1822_storage), None for a failed read or invalid address
+        """
+        if not is_address(address):
+            return None, None
+        
+        address = to_checksum_address(address)
+        results = await asyncio.gather(
+            self.web3.eth.get_storage_at(address, self.EIP1967_SLOT),
+            self.web3.eth.get_storage_at(address, self.EIP1822_SLOT),
+            return_exceptions=True
+        )
+        eip1967_storage, eip1822_storage = [None if isinstance(r, Exception) else r for r in results]
+        return eip1967_storage, eip1822_storage
+    
+    async def detect_proxy(
+        self,
+        address: str,
+        calls: Optional[PrefetchedCalls] = None,
+        slots: Optional[Tuple[Optional[bytes], Optional[bytes]]] = None
+    ) -> Tuple[bool, Optional[str], str]:
         """
         Detect if address is a proxy and find implementation.
+        slots takes a read_proxy_slots result that was fetched ahead of time.
         Returns: (is_proxy, implementation_address, evidence)
         """
+        calls = calls or self._direct_calls
         if not is_address(address):
             return False, None, "Invalid address"
         
         address = to_checksum_address(address)
+        if slots is None:
+            slots = await self.read_proxy_slots(address)
+        eip1967_storage, eip1822_storage = slots
         
-        # Check EIP-1967 implementation slot
+        # Check EIP-1967 implementation slot (a failed read is None and falls through)
         try:
             impl_slot = self.PROXY_PATTERNS["EIP-1967"]
-            storage = self.web3.eth.get_storage_at(address, int(impl_slot, 16))
-            impl_address = self.web3.to_checksum_address("0x" + storage.hex()[-40:])
+            impl_bytes = bytes(eip1967_storage[-20:])
             
-            if impl_address != "0x0000000000000000000000000000000000000000":
-                return True, impl_address, f"EIP-1967 proxy, implementation at slot {impl_slot}"
+            if impl_bytes != _ZERO_ADDRESS:
+                return True, to_checksum_address(impl_bytes), f"EIP-1967 proxy, implementation at slot {impl_slot}"
         except Exception:
             pass
         
         # Check EIP-1822 proxiable slot
         try:
             proxiable_slot = self.PROXY_PATTERNS["EIP-1822"]
-            storage = self.web3.eth.get_storage_at(address, int(proxiable_slot, 16))
-            impl_address = self.web3.to_checksum_address("0x" + storage.hex()[-40:])
+            impl_bytes = bytes(eip1822_storage[-20:])
             
-            if impl_address != "0x0000000000000000000000000000000000000000":
-                return True, impl_address, f"EIP-1822 UUPS proxy, implementation at slot {proxiable_slot}"
+            if impl_bytes != _ZERO_ADDRESS:
+                return True, to_checksum_address(impl_bytes), f"EIP-1822 UUPS proxy, implementation at slot {proxiable_slot}"
         except Exception:
             pass
         
         # Check for implementation() function (EIP-897)
         try:
-            impl_sig = self.web3.keccak(text="implementation()")[:4].hex()
-            result = self.web3.eth.call({"to": address, "data": impl_sig})
+            result = await calls.call(address, _IMPLEMENTATION_CALL)
             if len(result) == 32:
-                impl_address = self.web3.to_checksum_address("0x" + result.hex()[-40:])
-                if impl_address != "0x0000000000000000000000000000000000000000":
-                    return True, impl_address, "EIP-897 proxy with implementation() function"
+                impl_bytes = bytes(result[-20:])
+                if impl_bytes != _ZERO_ADDRESS:
+                    return True, to_checksum_address(impl_bytes), "EIP-897 proxy with implementation() function"
         except Exception:
             pass
         
         return False, None, "No proxy pattern detected"
     
-    def check_upgradeability(self, address: str, is_proxy: bool) -> Tuple[bool, str]:
+    async def check_upgradeability(
+        self,
+        address: str,
+        is_proxy: bool,
+        calls: Optional[PrefetchedCalls] = None
+    ) -> Tuple[bool, str]:
         """
         Determine if contract is upgradeable.
         Returns: (is_upgradeable, evidence)
@@ -85,23 +156,18 @@ class ContractAnalyzer:
         if not is_proxy:
             return False, "Not a proxy contract"
         
-        # Check for common upgrade functions
-        upgrade_functions = ["upgradeTo", "upgradeToAndCall", "setImplementation"]
+        calls = calls or self._direct_calls
         
-        for func_name in upgrade_functions:
+        # Check for common upgrade functions
+        for sig, probe_call in self.UPGRADE_PROBES:
+            # Try to call (will fail if function exists but we have no permission, but won't throw if function doesn't exist)
             try:
-                # Try multiple common signatures
-                for sig in [f"{func_name}(address)", f"{func_name}(address,bytes)"]:
-                    func_sig = self.web3.keccak(text=sig)[:4].hex()
-                    # Try to call (will fail if function exists but we have no permission, but won't throw if function doesn't exist)
-                    try:
-                        self.web3.eth.call({"to": address, "data": func_sig + "0" * 64})
-                    except Exception as e:
-                        # If we get an execution error (not "function not found"), function likely exists
-                        if "execution reverted" in str(e).lower() or "invalid opcode" in str(e).lower():
-                            return True, f"Upgradeable: {sig} function detected"
-            except Exception:
-                continue
+                await calls.call(address, probe_call)
+            except Exception as e:
+                # If we get an execution error (not "function not found"), function likely exists
+                message = str(e).lower()
+                if "execution reverted" in message or "invalid opcode" in message:
+                    return True, f"Upgradeable: {sig} function detected"
         
         # If proxy but no upgrade function found, likely immutable proxy
         return False, "Proxy detected but no upgrade function found (possibly immutable)"
@@ -122,32 +188,34 @@ class ContractAnalyzer:
             }
         
         # Search for mint functions
-        mint_patterns = [r'\bfunction\s+mint\s*\(', r'\bfunction\s+_mint\s*\(']
-        has_mint = any(re.search(pattern, source_code, re.IGNORECASE) for pattern in mint_patterns)
+        has_mint = _MINT_RE.search(source_code) is not None
         results["mint"] = (has_mint, "mint() function found in source" if has_mint else "No mint function detected")
         
         # Search for burn functions
-        burn_patterns = [r'\bfunction\s+burn\s*\(', r'\bfunction\s+_burn\s*\(', r'\bfunction\s+burnFrom\s*\(']
-        has_burn = any(re.search(pattern, source_code, re.IGNORECASE) for pattern in burn_patterns)
+        has_burn = _BURN_RE.search(source_code) is not None
         results["burn"] = (has_burn, "burn() function found in source" if has_burn else "No burn function detected")
         
         # Search for pause functions
-        pause_patterns = [r'\bfunction\s+pause\s*\(', r'\bwhenNotPaused\b']
-        has_pause = any(re.search(pattern, source_code, re.IGNORECASE) for pattern in pause_patterns)
+        has_pause = _PAUSE_RE.search(source_code) is not None
         results["pause"] = (has_pause, "pause mechanism found in source" if has_pause else "No pause mechanism detected")
         
         # Search for freeze/blacklist functions
-        freeze_patterns = [r'\bfunction\s+freeze\s*\(', r'\bfunction\s+blacklist\s*\(', r'\bfreeze.*Account\b']
-        has_freeze = any(re.search(pattern, source_code, re.IGNORECASE) for pattern in freeze_patterns)
+        has_freeze = _FREEZE_RE.search(source_code) is not None
         results["freeze"] = (has_freeze, "freeze/blacklist function found in source" if has_freeze else "No freeze mechanism detected")
         
         return results
     
-    def detect_ownership(self, source_code: Optional[str], address: str) -> Tuple[Optional[str], bool, str]:
+    async def detect_ownership(
+        self,
+        source_code: Optional[str],
+        address: str,
+        calls: Optional[PrefetchedCalls] = None
+    ) -> Tuple[Optional[str], bool, str]:
         """
         Detect owner and if ownership is renounced.
         Returns: (owner_address, is_renounced, evidence)
         """
+        calls = calls or self._direct_calls
         if not source_code:
             return None, False, "Source code not available for ownership analysis"
         
@@ -159,14 +227,14 @@ class ContractAnalyzer:
         
         # Try to read owner from contract
         try:
-            owner_sig = self.web3.keccak(text="owner()")[:4].hex()
-            result = self.web3.eth.call({"to": address, "data": owner_sig})
-            owner_address = self.web3.to_checksum_address("0x" + result.hex()[-40:])
+            result = await calls.call(address, _OWNER_CALL)
+            owner_bytes = bytes(result[-20:])
             
             # Check if owner is zero address (renounced)
-            if owner_address == "0x0000000000000000000000000000000000000000":
+            if owner_bytes == _ZERO_ADDRESS:
                 return None, True, "Ownership renounced (owner is zero address)"
             
+            owner_address = to_checksum_address(owner_bytes)
             return owner_address, False, f"Owner address: {owner_address}"
         
         except Exception as e:
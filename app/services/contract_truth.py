@@ -2,14 +2,70 @@
 Contract Truth Service - Main orchestrator.
 Combines blockchain analysis, explorer data, and risk detection.
 """
+import asyncio
 from datetime import datetime
-from typing import Dict, Optional
-from web3 import Web3
+from typing import Dict, List, Optional, Tuple
+import httpx
+from aiohttp import ClientSession
+from eth_utils import is_address
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, AsyncHTTPProvider
 from app.core.models import ContractTruthResponse, CertainData, RiskFlagDetail
-from app.core.enums import DataCertainty, RiskFlag
+from app.core.enums import DataCertainty, RiskFlag, RISK_SEVERITY
 from app.core.config import settings
 from app.services.contract_analyzer import ContractAnalyzer
 from app.services.explorer_client import ExplorerClient
+from app.services.multicall import MulticallBatcher, PrefetchedCalls, calldata
+
+_TOTAL_SUPPLY_CALL = calldata("totalSupply()")
+_DECIMALS_CALL = calldata("decimals()")
+
+# Admin capabilities scanned for in source, with the flag raised when found
+_ADMIN_FUNCTION_FLAGS = (
+    ("mint", RiskFlag.MINTABLE),
+    ("burn", RiskFlag.BURNABLE),
+    ("pause", RiskFlag.PAUSABLE),
+    ("freeze", RiskFlag.FREEZABLE),
+)
+_ADMIN_FUNCTION_NAMES = tuple(name for name, _ in _ADMIN_FUNCTION_FLAGS)
+
+# Fixed UNKNOWN data points, shared by every response (never mutated after construction)
+_UNKNOWN_SOURCE = CertainData.model_construct(
+    value=False,
+    certainty=DataCertainty.UNKNOWN,
+    source=None,
+    reason="Source code not available"
+)
+_UNKNOWN_OWNER = CertainData.model_construct(
+    value=None,
+    certainty=DataCertainty.UNKNOWN,
+    source=None,
+    reason="Source code not available for ownership analysis"
+)
+_UNKNOWN_OWNERSHIP_RENOUNCED = CertainData.model_construct(
+    value=False,
+    certainty=DataCertainty.UNKNOWN,
+    source=None,
+    reason="Source code not available for ownership analysis"
+)
+_UNKNOWN_SUPPLY_HISTORY = CertainData.model_construct(
+    value=None,
+    certainty=DataCertainty.UNKNOWN,
+    source=None,
+    reason="Historical supply tracking not implemented (requires indexed events)"
+)
+_UNKNOWN_CROSS_CHAIN_ADDRESSES = CertainData.model_construct(
+    value={},
+    certainty=DataCertainty.UNKNOWN,
+    source=None,
+    reason="Cross-chain token mapping requires external registry (not implemented)"
+)
+_UNKNOWN_CROSS_CHAIN_CONFIDENCE = CertainData.model_construct(
+    value=None,
+    certainty=DataCertainty.UNKNOWN,
+    source=None,
+    reason="Cross-chain detection not implemented"
+)
 
 
 class ContractTruthService:
@@ -25,21 +81,94 @@ class ContractTruthService:
         if not rpc_url:
             raise ValueError(f"No RPC URL configured for chain: {chain}")
         
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        self.rpc_url = rpc_url
+        self.web3 = AsyncWeb3(AsyncHTTPProvider(rpc_url))
         self.analyzer = ContractAnalyzer(self.web3)
+        self.multicall = MulticallBatcher(self.web3)
         self.explorer = ExplorerClient(chain)
+        self._rpc_client: Optional[httpx.AsyncClient] = None
+    
+    async def get_codes(self, addresses: List[Optional[str]]) -> List[Optional[bytes]]:
+        """
+        Fetch runtime bytecode for several addresses, in order.
+        Empty addresses are skipped and failed lookups come back as None.
+        With settings.rpc_batch_requests the lookups share one JSON-RPC batch POST.
+        """
+        codes: List[Optional[bytes]] = [None] * len(addresses)
+        targets = [(i, address) for i, address in enumerate(addresses) if address]
+        
+        if settings.rpc_batch_requests and len(targets) > 1:
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": "eth_getCode", "params": [address, "latest"]}
+                for i, address in targets
+            ]
+            try:
+                response = await self._get_rpc_client().post(self.rpc_url, json=payload)
+                response.raise_for_status()
+                for item in response.json():
+                    if item.get("result") is not None:
+                        codes[item["id"]] = HexBytes(item["result"])
+            except Exception:
+                pass
+            return codes
+        
+        results = await asyncio.gather(
+            *[self.web3.eth.get_code(address) for _, address in targets],
+            return_exceptions=True
+        )
+        for (i, _), result in zip(targets, results):
+            if not isinstance(result, Exception):
+                codes[i] = result
+        return codes
+    
+    def _get_rpc_client(self) -> httpx.AsyncClient:
+        """HTTP client for raw JSON-RPC batches, created on first use and kept alive."""
+        if self._rpc_client is None or self._rpc_client.is_closed:
+            self._rpc_client = httpx.AsyncClient(
+                timeout=10.0,
+                limits=httpx.Limits(max_keepalive_connections=50)
+            )
+        return self._rpc_client
+    
+    async def close(self) -> None:
+        """Close the JSON-RPC batch client, the explorer client and web3's RPC session."""
+        if self._rpc_client is not None:
+            await self._rpc_client.aclose()
+            self._rpc_client = None
+        await self.explorer.close()
+        
+        # web3 keeps one aiohttp session per RPC URL and only exposes it through
+        # cache_async_session, which returns the cached session when there is one
+        probe = ClientSession()
+        session = await self.web3.provider.cache_async_session(probe)
+        if session is not probe:
+            await probe.close()
+        await session.close()
     
     async def analyze_contract(self, address: str) -> ContractTruthResponse:
         """
         Full contract analysis pipeline.
         Every field is classified as PROVEN, INFERRED, or UNKNOWN.
+        Models are built with model_construct: every value here is produced
+        by this service, so pydantic validation would only re-check it.
         """
         risk_flags = []
         
-        # Step 1: Fetch source code and verification status
-        source_data = await self.explorer.get_contract_source(address)
-        
-        is_verified = CertainData(
+        # Step 1: Fetch source code and verification status; the on-chain
+        # reads (eth_call prefetch and proxy detection) run alongside it
+        source_data, chain_state = await asyncio.gather(
+            self.explorer.get_contract_source(address),
+            self._read_chain_state(address),
+            return_exceptions=True
+        )
+        # Both reads have settled, so nothing is left running if either one failed
+        for result in (source_data, chain_state):
+            if isinstance(result, BaseException):
+                raise result
+        calls, proxy_result, rpc_error = chain_state
+        upstream_errors = [error for error in (source_data.get("error"), rpc_error) if error]
+        
+        is_verified = CertainData.model_construct(
             value=source_data.get("verified", False),
             certainty=DataCertainty.PROVEN,
             source=f"{self.chain} block explorer API",
@@ -47,14 +176,14 @@ class ContractTruthService:
         )
         
         source_code = source_data.get("source_code")
-        source_code_available = CertainData(
+        source_code_available = CertainData.model_construct(
             value=source_code is not None,
             certainty=DataCertainty.PROVEN,
             source=f"{self.chain} block explorer API",
             reason=None
         )
         
-        compiler_version = CertainData(
+        compiler_version = CertainData.model_construct(
             value=source_data.get("compiler_version"),
             certainty=DataCertainty.PROVEN if source_data.get("verified") else DataCertainty.UNKNOWN,
             source=f"{self.chain} block explorer API" if source_data.get("verified") else None,
@@ -63,24 +192,24 @@ class ContractTruthService:
         
         # Risk flag: Unverified contract
         if not is_verified.value:
-            risk_flags.append(RiskFlagDetail(
+            risk_flags.append(RiskFlagDetail.model_construct(
                 flag=RiskFlag.UNVERIFIED_CONTRACT,
                 evidence=f"Contract source code not verified on {self.chain} explorer",
-                severity=8,
+                severity=RISK_SEVERITY[RiskFlag.UNVERIFIED_CONTRACT],
                 certainty=DataCertainty.PROVEN
             ))
         
         # Step 2: Proxy detection
-        is_proxy_val, impl_address, proxy_evidence = self.analyzer.detect_proxy(address)
+        is_proxy_val, impl_address, proxy_evidence = proxy_result
         
-        is_proxy = CertainData(
+        is_proxy = CertainData.model_construct(
             value=is_proxy_val,
             certainty=DataCertainty.PROVEN,
             source="On-chain storage slots (EIP-1967/1822/897)",
             reason=proxy_evidence
         )
         
-        implementation_address = CertainData(
+        implementation_address = CertainData.model_construct(
             value=impl_address,
             certainty=DataCertainty.PROVEN if is_proxy_val else DataCertainty.UNKNOWN,
             source="On-chain storage slots",
@@ -88,9 +217,9 @@ class ContractTruthService:
         )
         
         # Step 3: Upgradeability check
-        is_upgradeable_val, upgrade_evidence = self.analyzer.check_upgradeability(address, is_proxy_val)
+        is_upgradeable_val, upgrade_evidence = await self.analyzer.check_upgradeability(address, is_proxy_val, calls)
         
-        is_upgradeable = CertainData(
+        is_upgradeable = CertainData.model_construct(
             value=is_upgradeable_val,
             certainty=DataCertainty.PROVEN if is_proxy_val else DataCertainty.INFERRED,
             source="On-chain function signature detection",
@@ -99,148 +228,84 @@ class ContractTruthService:
         
         # Risk flag: Upgradeable proxy
         if is_upgradeable_val:
-            risk_flags.append(RiskFlagDetail(
+            risk_flags.append(RiskFlagDetail.model_construct(
                 flag=RiskFlag.UPGRADEABLE_PROXY,
                 evidence=upgrade_evidence,
-                severity=7,
+                severity=RISK_SEVERITY[RiskFlag.UPGRADEABLE_PROXY],
                 certainty=DataCertainty.PROVEN
             ))
         
         # Step 4: Admin function detection
-        admin_functions = self.analyzer.detect_admin_functions(source_code)
-        
-        has_mint_val, mint_evidence = admin_functions.get("mint", (False, "Cannot determine"))
-        has_mint_function = CertainData(
-            value=has_mint_val,
-            certainty=DataCertainty.PROVEN if source_code else DataCertainty.UNKNOWN,
-            source="Source code analysis" if source_code else None,
-            reason=mint_evidence if source_code else "Source code not available"
-        )
-        
-        if has_mint_val:
-            risk_flags.append(RiskFlagDetail(
-                flag=RiskFlag.MINTABLE,
-                evidence=mint_evidence,
-                severity=6,
-                certainty=DataCertainty.PROVEN
-            ))
-        
-        has_burn_val, burn_evidence = admin_functions.get("burn", (False, "Cannot determine"))
-        has_burn_function = CertainData(
-            value=has_burn_val,
-            certainty=DataCertainty.PROVEN if source_code else DataCertainty.UNKNOWN,
-            source="Source code analysis" if source_code else None,
-            reason=burn_evidence if source_code else "Source code not available"
-        )
-        
-        if has_burn_val:
-            risk_flags.append(RiskFlagDetail(
-                flag=RiskFlag.BURNABLE,
-                evidence=burn_evidence,
-                severity=3,
-                certainty=DataCertainty.PROVEN
-            ))
-        
-        has_pause_val, pause_evidence = admin_functions.get("pause", (False, "Cannot determine"))
-        has_pause_function = CertainData(
-            value=has_pause_val,
-            certainty=DataCertainty.PROVEN if source_code else DataCertainty.UNKNOWN,
-            source="Source code analysis" if source_code else None,
-            reason=pause_evidence if source_code else "Source code not available"
-        )
-        
-        if has_pause_val:
-            risk_flags.append(RiskFlagDetail(
-                flag=RiskFlag.PAUSABLE,
-                evidence=pause_evidence,
-                severity=7,
-                certainty=DataCertainty.PROVEN
-            ))
-        
-        has_freeze_val, freeze_evidence = admin_functions.get("freeze", (False, "Cannot determine"))
-        has_freeze_function = CertainData(
-            value=has_freeze_val,
-            certainty=DataCertainty.PROVEN if source_code else DataCertainty.UNKNOWN,
-            source="Source code analysis" if source_code else None,
-            reason=freeze_evidence if source_code else "Source code not available"
-        )
-        
-        if has_freeze_val:
-            risk_flags.append(RiskFlagDetail(
-                flag=RiskFlag.FREEZABLE,
-                evidence=freeze_evidence,
-                severity=8,
-                certainty=DataCertainty.PROVEN
-            ))
+        if source_code:
+            admin_functions = self.analyzer.detect_admin_functions(source_code)
+            admin_data: Dict[str, CertainData] = {}
+            for name, flag in _ADMIN_FUNCTION_FLAGS:
+                has_val, evidence = admin_functions.get(name, (False, "Cannot determine"))
+                admin_data[name] = CertainData.model_construct(
+                    value=has_val,
+                    certainty=DataCertainty.PROVEN,
+                    source="Source code analysis",
+                    reason=evidence
+                )
+                
+                if has_val:
+                    risk_flags.append(RiskFlagDetail.model_construct(
+                        flag=flag,
+                        evidence=evidence,
+                        severity=RISK_SEVERITY[flag],
+                        certainty=DataCertainty.PROVEN
+                    ))
+        else:
+            # Nothing to scan: every admin check is the same UNKNOWN
+            admin_data = dict.fromkeys(_ADMIN_FUNCTION_NAMES, _UNKNOWN_SOURCE)
         
         # Step 5: Ownership detection
-        owner_addr, is_renounced, ownership_evidence = self.analyzer.detect_ownership(source_code, address)
-        
-        owner_address = CertainData(
-            value=owner_addr,
-            certainty=DataCertainty.PROVEN if source_code else DataCertainty.UNKNOWN,
-            source="On-chain owner() call" if source_code else None,
-            reason=ownership_evidence
-        )
-        
-        ownership_renounced = CertainData(
-            value=is_renounced,
-            certainty=DataCertainty.PROVEN if source_code else DataCertainty.UNKNOWN,
-            source="On-chain owner() call" if source_code else None,
-            reason=ownership_evidence
-        )
-        
-        if not is_renounced and owner_addr:
-            risk_flags.append(RiskFlagDetail(
-                flag=RiskFlag.OWNERSHIP_NOT_RENOUNCED,
-                evidence=f"Active owner: {owner_addr}",
-                severity=5,
-                certainty=DataCertainty.PROVEN
-            ))
+        if source_code:
+            owner_addr, is_renounced, ownership_evidence = await self.analyzer.detect_ownership(source_code, address, calls)
+            
+            owner_address = CertainData.model_construct(
+                value=owner_addr,
+                certainty=DataCertainty.PROVEN,
+                source="On-chain owner() call",
+                reason=ownership_evidence
+            )
+            
+            ownership_renounced = CertainData.model_construct(
+                value=is_renounced,
+                certainty=DataCertainty.PROVEN,
+                source="On-chain owner() call",
+                reason=ownership_evidence
+            )
+            
+            if not is_renounced and owner_addr:
+                risk_flags.append(RiskFlagDetail.model_construct(
+                    flag=RiskFlag.OWNERSHIP_NOT_RENOUNCED,
+                    evidence=f"Active owner: {owner_addr}",
+                    severity=RISK_SEVERITY[RiskFlag.OWNERSHIP_NOT_RENOUNCED],
+                    certainty=DataCertainty.PROVEN
+                ))
+        else:
+            owner_address = _UNKNOWN_OWNER
+            ownership_renounced = _UNKNOWN_OWNERSHIP_RENOUNCED
         
         # Step 6: Supply tracking
-        total_supply_val = await self._get_total_supply(address)
-        total_supply = CertainData(
+        total_supply_val = await self._get_total_supply(address, calls)
+        total_supply = CertainData.model_construct(
             value=total_supply_val,
             certainty=DataCertainty.PROVEN if total_supply_val is not None else DataCertainty.UNKNOWN,
             source="On-chain totalSupply() call" if total_supply_val is not None else None,
             reason="totalSupply() call failed" if total_supply_val is None else None
         )
         
-        # Supply change tracking (INFERRED - requires historical data)
-        supply_change_24h = CertainData(
-            value=None,
-            certainty=DataCertainty.UNKNOWN,
-            source=None,
-            reason="Historical supply tracking not implemented (requires indexed events)"
-        )
-        
-        supply_change_7d = CertainData(
-            value=None,
-            certainty=DataCertainty.UNKNOWN,
-            source=None,
-            reason="Historical supply tracking not implemented (requires indexed events)"
-        )
-        
-        # Step 7: Cross-chain detection (INFERRED)
-        cross_chain_addresses = CertainData(
-            value={},
-            certainty=DataCertainty.UNKNOWN,
-            source=None,
-            reason="Cross-chain token mapping requires external registry (not implemented)"
-        )
-        
-        cross_chain_confidence = CertainData(
-            value=None,
-            certainty=DataCertainty.UNKNOWN,
-            source=None,
-            reason="Cross-chain detection not implemented"
-        )
+        # Supply history and cross-chain mapping are not implemented
+        supply_change_24h = supply_change_7d = _UNKNOWN_SUPPLY_HISTORY
+        cross_chain_addresses = _UNKNOWN_CROSS_CHAIN_ADDRESSES
+        cross_chain_confidence = _UNKNOWN_CROSS_CHAIN_CONFIDENCE
         
         # Step 8: Calculate risk score
         contract_risk_score = self._calculate_risk_score(risk_flags)
         
-        return ContractTruthResponse(
+        return ContractTruthResponse.model_construct(
             chain=self.chain,
             address=address,
             timestamp=datetime.utcnow(),
@@ -250,10 +315,10 @@ class ContractTruthService:
             is_proxy=is_proxy,
             implementation_address=implementation_address,
             is_upgradeable=is_upgradeable,
-            has_mint_function=has_mint_function,
-            has_burn_function=has_burn_function,
-            has_pause_function=has_pause_function,
-            has_freeze_function=has_freeze_function,
+            has_mint_function=admin_data["mint"],
+            has_burn_function=admin_data["burn"],
+            has_pause_function=admin_data["pause"],
+            has_freeze_function=admin_data["freeze"],
             owner_address=owner_address,
             ownership_renounced=ownership_renounced,
             total_supply=total_supply,
@@ -262,20 +327,53 @@ class ContractTruthService:
             cross_chain_addresses=cross_chain_addresses,
             cross_chain_confidence=cross_chain_confidence,
             risk_flags=risk_flags,
-            contract_risk_score=contract_risk_score
+            contract_risk_score=contract_risk_score,
+            upstream_errors=upstream_errors
         )
     
-    async def _get_total_supply(self, address: str) -> Optional[float]:
+    async def _read_chain_state(
+        self,
+        address: str
+    ) -> Tuple[PrefetchedCalls, Tuple[bool, Optional[str], str], Optional[str]]:
+        """
+        Prefetch every eth_call the analysis may need (one multicall, with
+        settings.rpc_multicall) alongside the proxy storage-slot reads, then
+        run proxy detection against both.
+        Returns (prefetched calls, detect_proxy result, RPC error or None).
+        """
+        if settings.rpc_multicall:
+            calls, slots = await asyncio.gather(
+                self.multicall.prefetch([
+                    *self.analyzer.batch_calls(address),
+                    (address, _TOTAL_SUPPLY_CALL),
+                    (address, _DECIMALS_CALL),
+                ]),
+                self.analyzer.read_proxy_slots(address)
+            )
+        else:
+            calls = PrefetchedCalls(self.web3)
+            slots = await self.analyzer.read_proxy_slots(address)
+        
+        # A valid address whose slot reads failed means the node is unreachable, not "no proxy"
+        rpc_error = None
+        if is_address(address) and None in slots:
+            rpc_error = f"{self.chain} RPC error reading proxy storage slots"
+        
+        return calls, await self.analyzer.detect_proxy(address, calls, slots), rpc_error
+    
+    async def _get_total_supply(self, address: str, calls: PrefetchedCalls) -> Optional[float]:
         """Query totalSupply() from contract."""
         try:
-            total_supply_sig = self.web3.keccak(text="totalSupply()")[:4].hex()
-            result = self.web3.eth.call({"to": address, "data": total_supply_sig})
-            supply_wei = int(result.hex(), 16)
+            result = await calls.call(address, _TOTAL_SUPPLY_CALL)
+            if not result:
+                return None
+            supply_wei = int.from_bytes(result, "big")
             
             # Get decimals
-            decimals_sig = self.web3.keccak(text="decimals()")[:4].hex()
-            decimals_result = self.web3.eth.call({"to": address, "data": decimals_sig})
-            decimals = int(decimals_result.hex(), 16)
+            decimals_result = await calls.call(address, _DECIMALS_CALL)
+            if not decimals_result:
+                return None
+            decimals = int.from_bytes(decimals_result, "big")
             
             return supply_wei / (10 ** decimals)
         
@@ -3,17 +3,43 @@ CryptoPanic API client.
 Fetches crypto news and sentiment data.
 """
 import httpx
+from collections import Counter
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from app.core.config import settings
 
 
+# Common words excluded from narrative keyword extraction
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "can", "this", "that", "these",
+    "those", "i", "you", "he", "she", "it", "we", "they", "what", "which"
+})
+_WORD_STRIP_CHARS = ".,!?;:()[]{}\"'"
+
+
 class CryptoPanicClient:
     """Client for CryptoPanic news and sentiment API."""
     
     def __init__(self):
         self.base_url = settings.cryptopanic_base_url
         self.api_key = settings.cryptopanic_api_key
+        self.timeout = 15.0
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_news(
         self,
@@ -49,35 +75,35 @@ class CryptoPanicClient:
             params["kind"] = kind
         
         try:
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                # Use v2 API endpoint
-                response = await client.get(f"{self.base_url}/posts/", params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Filter by time window (make cutoff timezone-aware)
-                from datetime import timezone
-                cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-                results = data.get("results", [])
-                
-                filtered_results = []
-                for item in results:
-                    published_at_str = item.get("published_at", "")
-                    if not published_at_str:
-                        continue
-                    
-                    # Parse timezone-aware datetime
-                    published_at = datetime.fromisoformat(
-                        published_at_str.replace("Z", "+00:00")
-                    )
-                    if published_at >= cutoff:
-                        filtered_results.append(item)
+            client = self._get_client()
+            # Use v2 API endpoint
+            response = await client.get(f"{self.base_url}/posts/", params=params)
+            response.raise_for_status()
+            data = response.json()
+            
+            # Filter by time window (make cutoff timezone-aware)
+            from datetime import timezone
+            cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+            results = data.get("results", [])
+            
+            filtered_results = []
+            for item in results:
+                published_at_str = item.get("published_at", "")
+                if not published_at_str:
+                    continue
                 
-                return {
-                    "results": filtered_results,
-                    "count": len(filtered_results),
-                    "error": None
-                }
+                # Parse timezone-aware datetime
+                published_at = datetime.fromisoformat(
+                    published_at_str.replace("Z", "+00:00")
+                )
+                if published_at >= cutoff:
+                    filtered_results.append(item)
+            
+            return {
+                "results": filtered_results,
+                "count": len(filtered_results),
+                "error": None
+            }
         
         except httpx.HTTPError as e:
             return {
@@ -238,28 +264,13 @@ class CryptoPanicClient:
         if not news_items:
             return []
         
-        # Count word frequencies (excluding common words)
-        stop_words = {
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "is", "are", "was", "were", "be", "been", "being",
-            "have", "has", "had", "do", "does", "did", "will", "would", "could",
-            "should", "may", "might", "must", "can", "this", "that", "these",
-            "those", "i", "you", "he", "she", "it", "we", "they", "what", "which"
-        }
-        
-        word_counts = {}
-        
-        for item in news_items:
-            title = item.get("title", "").lower()
-            words = title.split()
-            
-            for word in words:
-                # Clean word
-                word = word.strip(".,!?;:()[]{}\"'")
-                if len(word) > 3 and word not in stop_words:
-                    word_counts[word] = word_counts.get(word, 0) + 1
-        
-        # Sort by frequency
-        sorted_words = sorted(word_counts.items(), key=lambda x: x[1], reverse=True)
+        # Count word frequencies (excluding common words); tokens are cleaned once each
+        word_counts = Counter(
+            word
+            for item in news_items
+            for word in (raw.strip(_WORD_STRIP_CHARS) for raw in item.get("title", "").lower().split())
+            if len(word) > 3 and word not in _STOP_WORDS
+        )
         
-        return [word for word, count in sorted_words[:top_n]]
+        # Top-N by frequency (heap-based, ties keep first-seen order)
+        return [word for word, count in word_counts.most_common(top_n)]
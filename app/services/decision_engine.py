@@ -39,6 +39,11 @@ class DecisionEngine:
     DO_NOT_LIST_THRESHOLD = 70
     LIST_WITH_LIMITS_THRESHOLD = 40
     
+    # Overall risk weights (sum to 1.0)
+    CONTRACT_RISK_WEIGHT = 0.50
+    LIQUIDITY_RISK_WEIGHT = 0.35
+    NARRATIVE_RISK_WEIGHT = 0.15
+    
     def make_decision(
         self,
         contract: ContractTruthResponse,
@@ -93,16 +98,10 @@ class DecisionEngine:
         Weighted average of risk scores.
         Contract safety is most important, then liquidity, then narrative.
         """
-        weights = {
-            "contract": 0.50,  # 50% weight
-            "liquidity": 0.35,  # 35% weight
-            "narrative": 0.15,  # 15% weight
-        }
-        
         weighted_score = (
-            contract_score * weights["contract"] +
-            liquidity_score * weights["liquidity"] +
-            narrative_score * weights["narrative"]
+            contract_score * self.CONTRACT_RISK_WEIGHT +
+            liquidity_score * self.LIQUIDITY_RISK_WEIGHT +
+            narrative_score * self.NARRATIVE_RISK_WEIGHT
         )
         
         return int(weighted_score)
@@ -151,8 +150,8 @@ class DecisionEngine:
         Determine final decision based on risk score, flags, and unknowns.
         Returns: (decision, reasoning)
         """
-        # Extract flag types
-        flag_types = {flag.flag for flag in risk_flags}
+        # Extract flag types (deduplicated, in the order they were raised)
+        flag_types = list(dict.fromkeys(flag.flag for flag in risk_flags))
         
         # Check for critical unknowns
         critical_unknowns_blocking = [
@@ -167,7 +166,7 @@ class DecisionEngine:
             )
         
         # Check for critical flags
-        critical_flags_present = flag_types.intersection(self.CRITICAL_FLAGS)
+        critical_flags_present = [f for f in flag_types if f in self.CRITICAL_FLAGS]
         
         if critical_flags_present:
             critical_names = [f.value for f in critical_flags_present]
@@ -184,7 +183,7 @@ class DecisionEngine:
             )
         
         # Check for warning flags
-        warning_flags_present = flag_types.intersection(self.WARNING_FLAGS)
+        warning_flags_present = [f for f in flag_types if f in self.WARNING_FLAGS]
         
         if warning_flags_present or overall_risk_score >= self.LIST_WITH_LIMITS_THRESHOLD:
             warning_names = [f.value for f in warning_flags_present]
@@ -13,6 +13,22 @@ class DefiLlamaClient:
         self.base_url = "https://api.llama.fi"
         self.coins_url = "https://coins.llama.fi"
         self.timeout = 15.0
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=50)
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_token_price(self, chain: str, address: str) -> Tuple[Optional[float], Optional[StructuredError]]:
         """Get current token price."""
@@ -20,24 +36,24 @@ class DefiLlamaClient:
             # DefiLlama format: chain:address
             coin_id = f"{chain}:{address}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.coins_url}/prices/current/{coin_id}"
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "coins" in data and coin_id in data["coins"]:
-                    price = data["coins"][coin_id].get("price")
-                    return price, None
-                
-                return None, StructuredError(
-                    code=ErrorCode.UPSTREAM_ERROR,
-                    message=f"Token {coin_id} not found in DefiLlama",
-                    source="defillama",
-                    retryable=False
-                )
-                
+            client = self._get_client()
+            response = await client.get(
+                f"{self.coins_url}/prices/current/{coin_id}"
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "coins" in data and coin_id in data["coins"]:
+                price = data["coins"][coin_id].get("price")
+                return price, None
+            
+            return None, StructuredError(
+                code=ErrorCode.UPSTREAM_ERROR,
+                message=f"Token {coin_id} not found in DefiLlama",
+                source="defillama",
+                retryable=False
+            )
+            
         except httpx.TimeoutException:
             return None, StructuredError(
                 code=ErrorCode.UPSTREAM_TIMEOUT,
@@ -63,15 +79,15 @@ class DefiLlamaClient:
     async def get_protocol_tvl(self, protocol_slug: str) -> Tuple[Optional[Dict], Optional[StructuredError]]:
         """Get protocol TVL and chain breakdown."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.base_url}/protocol/{protocol_slug}"
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                return data, None
-                
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/protocol/{protocol_slug}"
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            return data, None
+            
         except httpx.TimeoutException:
             return None, StructuredError(
                 code=ErrorCode.UPSTREAM_TIMEOUT,
@@ -101,26 +117,26 @@ class DefiLlamaClient:
         try:
             coin_id = f"{chain}:{address}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Historical prices endpoint
-                response = await client.get(
-                    f"{self.coins_url}/chart/{coin_id}",
-                    params={"span": days_back}
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "coins" in data and coin_id in data["coins"]:
-                    prices = data["coins"][coin_id].get("prices", [])
-                    return prices, None
-                
-                return None, StructuredError(
-                    code=ErrorCode.UPSTREAM_ERROR,
-                    message="Historical data not available",
-                    source="defillama",
-                    retryable=False
-                )
-                
+            client = self._get_client()
+            # Historical prices endpoint
+            response = await client.get(
+                f"{self.coins_url}/chart/{coin_id}",
+                params={"span": days_back}
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "coins" in data and coin_id in data["coins"]:
+                prices = data["coins"][coin_id].get("prices", [])
+                return prices, None
+            
+            return None, StructuredError(
+                code=ErrorCode.UPSTREAM_ERROR,
+                message="Historical data not available",
+                source="defillama",
+                retryable=False
+            )
+            
         except Exception as e:
             return None, StructuredError(
                 code=ErrorCode.UPSTREAM_ERROR,
@@ -132,13 +148,13 @@ class DefiLlamaClient:
     async def get_stablecoins(self) -> Tuple[Optional[List[Dict]], Optional[StructuredError]]:
         """Get stablecoin data (useful for reference)."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.base_url}/stablecoins")
-                response.raise_for_status()
-                data = response.json()
-                
-                return data.get("peggedAssets", []), None
-                
+            client = self._get_client()
+            response = await client.get(f"{self.base_url}/stablecoins")
+            response.raise_for_status()
+            data = response.json()
+            
+            return data.get("peggedAssets", []), None
+            
         except Exception as e:
             return None, StructuredError(
                 code=ErrorCode.UPSTREAM_ERROR,
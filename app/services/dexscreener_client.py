@@ -3,6 +3,7 @@ DexScreener API client.
 Fetches DEX liquidity, volume, and pair data.
 """
 import httpx
+import orjson
 from typing import Dict, List, Optional, Any
 from app.core.config import settings
 
@@ -12,6 +13,23 @@ class DexScreenerClient:
     
     def __init__(self):
         self.base_url = settings.dexscreener_base_url
+        self.timeout = 15.0
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=50)
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_token_pairs(self, chain: str, address: str) -> Dict[str, Any]:
         """
@@ -40,22 +58,23 @@ class DexScreenerClient:
         try:
             url = f"{self.base_url}/dex/tokens/{address}"
             
-            async with httpx.AsyncClient(timeout=15.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Filter pairs by chain
-                all_pairs = data.get("pairs", [])
-                chain_pairs = [
-                    pair for pair in all_pairs
-                    if pair.get("chainId", "").lower() == chain_id.lower()
-                ]
-                
-                return {
-                    "pairs": chain_pairs,
-                    "error": None
-                }
+            client = self._get_client()
+            response = await client.get(url)
+            response.raise_for_status()
+            # Pair listings for popular tokens are large; orjson parses them much faster
+            data = orjson.loads(response.content)
+            
+            # Filter pairs by chain
+            all_pairs = data.get("pairs", [])
+            chain_pairs = [
+                pair for pair in all_pairs
+                if pair.get("chainId", "").lower() == chain_id.lower()
+            ]
+            
+            return {
+                "pairs": chain_pairs,
+                "error": None
+            }
         
         except httpx.HTTPError as e:
             return {
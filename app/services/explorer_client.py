@@ -33,10 +33,23 @@ class ExplorerClient:
         self.base_url = self.EXPLORER_URLS.get(self.chain)
         self.chain_id = self.CHAIN_IDS.get(self.chain)
         self.api_key = settings.get_explorer_api_key(self.chain)
+        self._client: Optional[httpx.AsyncClient] = None
         
         if not self.base_url:
             raise ValueError(f"Unsupported chain: {chain}")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=10.0)
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     async def get_contract_source(self, address: str) -> Dict[str, Any]:
         """
         Fetch contract source code and verification status.
@@ -58,30 +71,30 @@ class ExplorerClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("status") != "1" or not data.get("result"):
-                    return {
-                        "verified": False,
-                        "source_code": None,
-                        "error": "Contract not verified or not found"
-                    }
-                
-                result = data["result"][0]
-                source_code = result.get("SourceCode", "")
-                
+            client = self._get_client()
+            response = await client.get(self.base_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            
+            if data.get("status") != "1" or not data.get("result"):
                 return {
-                    "verified": bool(source_code),
-                    "source_code": source_code if source_code else None,
-                    "abi": result.get("ABI"),
-                    "compiler_version": result.get("CompilerVersion"),
-                    "optimization_used": result.get("OptimizationUsed") == "1",
-                    "contract_name": result.get("ContractName"),
-                    "constructor_arguments": result.get("ConstructorArguments"),
+                    "verified": False,
+                    "source_code": None,
+                    "error": "Contract not verified or not found"
                 }
+            
+            result = data["result"][0]
+            source_code = result.get("SourceCode", "")
+            
+            return {
+                "verified": bool(source_code),
+                "source_code": source_code if source_code else None,
+                "abi": result.get("ABI"),
+                "compiler_version": result.get("CompilerVersion"),
+                "optimization_used": result.get("OptimizationUsed") == "1",
+                "contract_name": result.get("ContractName"),
+                "constructor_arguments": result.get("ConstructorArguments"),
+            }
         
         except httpx.HTTPError as e:
             return {
@@ -113,14 +126,14 @@ class ExplorerClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(self.base_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                if data.get("result"):
-                    return int(data["result"], 16)
-                return None
+            client = self._get_client()
+            response = await client.get(self.base_url, params=params)
+            response.raise_for_status()
+            data = response.json()
+            
+            if data.get("result"):
+                return int(data["result"], 16)
+            return None
         
         except Exception:
             return None
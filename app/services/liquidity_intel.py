@@ -5,7 +5,7 @@ Determines if token can be traded safely at size.
 from datetime import datetime
 from typing import Dict, Optional
 from app.core.models import LiquidityIntelResponse, CertainData, RiskFlagDetail
-from app.core.enums import DataCertainty, RiskFlag
+from app.core.enums import DataCertainty, RiskFlag, RISK_SEVERITY
 from app.services.dexscreener_client import DexScreenerClient
 
 
@@ -83,7 +83,7 @@ class LiquidityIntelService:
             risk_flags.append(RiskFlagDetail(
                 flag=RiskFlag.LOW_LIQUIDITY,
                 evidence=f"Total DEX liquidity: ${total_liquidity_usd.value:,.0f} (below ${self.LOW_LIQUIDITY_THRESHOLD_USD:,})",
-                severity=9,
+                severity=RISK_SEVERITY[RiskFlag.LOW_LIQUIDITY],
                 certainty=DataCertainty.PROVEN
             ))
         
@@ -92,7 +92,7 @@ class LiquidityIntelService:
             risk_flags.append(RiskFlagDetail(
                 flag=RiskFlag.CONCENTRATED_POOLS,
                 evidence=f"{top_pool_percentage.value:.1f}% of liquidity in single pool (threshold: {self.HIGH_CONCENTRATION_THRESHOLD_PCT}%)",
-                severity=6,
+                severity=RISK_SEVERITY[RiskFlag.CONCENTRATED_POOLS],
                 certainty=DataCertainty.PROVEN
             ))
         
@@ -126,7 +126,7 @@ class LiquidityIntelService:
             risk_flags.append(RiskFlagDetail(
                 flag=RiskFlag.LOW_VOLUME,
                 evidence=f"24h volume: ${volume_24h_usd.value:,.0f} (below ${self.LOW_VOLUME_THRESHOLD_USD:,})",
-                severity=7,
+                severity=RISK_SEVERITY[RiskFlag.LOW_VOLUME],
                 certainty=DataCertainty.PROVEN
             ))
         
@@ -168,7 +168,7 @@ class LiquidityIntelService:
                 risk_flags.append(RiskFlagDetail(
                     flag=RiskFlag.HIGH_SLIPPAGE,
                     evidence=f"Estimated {slippage_10k:.2f}% slippage for $10k trade (threshold: {self.HIGH_SLIPPAGE_THRESHOLD_PCT}%)",
-                    severity=8,
+                    severity=RISK_SEVERITY[RiskFlag.HIGH_SLIPPAGE],
                     certainty=DataCertainty.INFERRED
                 ))
         else:
@@ -196,7 +196,7 @@ class LiquidityIntelService:
             risk_flags.append(RiskFlagDetail(
                 flag=RiskFlag.NO_CEX_SUPPORT,
                 evidence="No CEX listings detected and low DEX liquidity",
-                severity=6,
+                severity=RISK_SEVERITY[RiskFlag.NO_CEX_SUPPORT],
                 certainty=DataCertainty.INFERRED
             ))
         
@@ -0,0 +1,86 @@
+"""
+Multicall3 batching for read-only EVM calls.
+Packs independent eth_calls into one aggregate3 call so a contract analysis
+costs one round-trip instead of one per read.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from eth_abi import decode, encode
+from eth_utils import is_address, keccak
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+# Same address on every chain Multicall3 is deployed to
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+_AGGREGATE3_SELECTOR = keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+
+
+def calldata(signature: str, zero_args: int = 0) -> str:
+    """Hex calldata for a function signature, followed by zero_args zero-valued words."""
+    return "0x" + keccak(text=signature)[:4].hex() + "00" * 32 * zero_args
+
+
+class CallReverted(Exception):
+    """A call that reverted inside a multicall batch."""
+
+
+class PrefetchedCalls:
+    """
+    eth_call results from one multicall, keyed by (target, calldata).
+    Reads that weren't prefetched go to the node as a normal eth_call.
+    """
+
+    def __init__(self, web3: AsyncWeb3, results: Optional[Dict[Tuple[str, str], Tuple[bool, bytes]]] = None):
+        self.web3 = web3
+        self._results = results or {}
+
+    async def call(self, to: str, data: str) -> bytes:
+        """
+        Return the call's output, like web3.eth.call.
+        A prefetched call that reverted raises CallReverted("execution reverted").
+        """
+        hit = self._results.get((to.lower(), data.lower()))
+        if hit is None:
+            return await self.web3.eth.call({"to": to, "data": data})
+
+        success, return_data = hit
+        if not success:
+            raise CallReverted("execution reverted")
+        return HexBytes(return_data)
+
+
+class MulticallBatcher:
+    """Runs batches of (target, calldata) reads through Multicall3.aggregate3."""
+
+    def __init__(self, web3: AsyncWeb3):
+        self.web3 = web3
+
+    async def prefetch(self, calls: List[Tuple[str, str]]) -> PrefetchedCalls:
+        """
+        Execute every read in one aggregate3 call (failures allowed per call).
+        If the batch itself fails (no Multicall3 on the chain, RPC error) the
+        result is empty and every read falls back to its own eth_call.
+        Targets that aren't valid addresses are left out of the batch.
+        """
+        unique_calls = list(dict.fromkeys(
+            (to.lower(), data.lower()) for to, data in calls if is_address(to)
+        ))
+        if not unique_calls:
+            return PrefetchedCalls(self.web3)
+
+        try:
+            payload = encode(
+                ["(address,bool,bytes)[]"],
+                [[(to, True, bytes(HexBytes(data))) for to, data in unique_calls]]
+            )
+            raw = await self.web3.eth.call({
+                "to": MULTICALL3_ADDRESS,
+                "data": HexBytes(_AGGREGATE3_SELECTOR + payload)
+            })
+            (results,) = decode(["(bool,bytes)[]"], bytes(raw))
+        except Exception:
+            return PrefetchedCalls(self.web3)
+
+        if len(results) != len(unique_calls):
+            return PrefetchedCalls(self.web3)
+        return PrefetchedCalls(self.web3, dict(zip(unique_calls, results)))
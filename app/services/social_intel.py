@@ -5,7 +5,7 @@ Uses CryptoPanic API for news-based signals.
 from datetime import datetime
 from typing import List
 from app.core.models import SocialIntelResponse, CertainData, RiskFlagDetail
-from app.core.enums import DataCertainty, RiskFlag
+from app.core.enums import DataCertainty, RiskFlag, RISK_SEVERITY
 from app.services.cryptopanic_client import CryptoPanicClient
 
 
@@ -54,7 +54,7 @@ class SocialIntelService:
             risk_flags.append(RiskFlagDetail(
                 flag=RiskFlag.LOW_ATTENTION,
                 evidence=f"Only {news_count_24h.value} news articles in past 24h",
-                severity=4,
+                severity=RISK_SEVERITY[RiskFlag.LOW_ATTENTION],
                 certainty=DataCertainty.PROVEN
             ))
         
@@ -81,7 +81,7 @@ class SocialIntelService:
                 risk_flags.append(RiskFlagDetail(
                     flag=RiskFlag.NEGATIVE_SENTIMENT,
                     evidence=f"Sentiment score: {sentiment_data['score']:.2f} (negative dominant)",
-                    severity=6,
+                    severity=RISK_SEVERITY[RiskFlag.NEGATIVE_SENTIMENT],
                     certainty=DataCertainty.INFERRED
                 ))
         else:
@@ -151,7 +151,7 @@ class SocialIntelService:
                 risk_flags.append(RiskFlagDetail(
                     flag=RiskFlag.COORDINATED_NARRATIVE,
                     evidence=f"Low source diversity: {diversity_data['diversity_score']:.2f} ({diversity_data['unique_sources']} sources for {diversity_data['total_articles']} articles)",
-                    severity=5,
+                    severity=RISK_SEVERITY[RiskFlag.COORDINATED_NARRATIVE],
                     certainty=DataCertainty.INFERRED
                 ))
         else:
@@ -209,7 +209,7 @@ class SocialIntelService:
                 RiskFlagDetail(
                     flag=RiskFlag.NO_SOCIAL_DATA,
                     evidence=error,
-                    severity=3,
+                    severity=RISK_SEVERITY[RiskFlag.NO_SOCIAL_DATA],
                     certainty=DataCertainty.PROVEN
                 )
             ],
@@ -17,36 +17,49 @@ class SolanaClient:
     def __init__(self):
         self.rpc_url = settings.solana_rpc_url or "https://api.mainnet-beta.solana.com"
         self.timeout = 15.0
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     async def get_token_supply(self, mint_address: str) -> Tuple[Optional[float], Optional[StructuredError]]:
         """Get SPL token supply."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.rpc_url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "getTokenSupply",
-                        "params": [mint_address]
-                    }
+            client = self._get_client()
+            response = await client.post(
+                self.rpc_url,
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "getTokenSupply",
+                    "params": [mint_address]
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "error" in data:
+                return None, StructuredError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message=f"Solana RPC error: {data['error'].get('message', 'Unknown')}",
+                    source="solana_rpc",
+                    retryable=False
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "error" in data:
-                    return None, StructuredError(
-                        code=ErrorCode.UPSTREAM_ERROR,
-                        message=f"Solana RPC error: {data['error'].get('message', 'Unknown')}",
-                        source="solana_rpc",
-                        retryable=False
-                    )
-                
-                result = data.get("result", {})
-                supply = result.get("value", {})
-                ui_amount = supply.get("uiAmount")
-                
-                return ui_amount, None
+            
+            result = data.get("result", {})
+            supply = result.get("value", {})
+            ui_amount = supply.get("uiAmount")
+            
+            return ui_amount, None
                 
         except httpx.TimeoutException:
             return None, StructuredError(
@@ -66,32 +79,32 @@ class SolanaClient:
     async def get_account_info(self, address: str) -> Tuple[Optional[Dict[str, Any]], Optional[StructuredError]]:
         """Get account info including program data."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    self.rpc_url,
-                    json={
-                        "jsonrpc": "2.0",
-                        "id": 1,
-                        "method": "getAccountInfo",
-                        "params": [
-                            address,
-                            {"encoding": "base64"}
-                        ]
-                    }
+            client = self._get_client()
+            response = await client.post(
+                self.rpc_url,
+                json={
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "getAccountInfo",
+                    "params": [
+                        address,
+                        {"encoding": "base64"}
+                    ]
+                }
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "error" in data:
+                return None, StructuredError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message=f"Solana RPC error: {data['error'].get('message', 'Unknown')}",
+                    source="solana_rpc",
+                    retryable=False
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "error" in data:
-                    return None, StructuredError(
-                        code=ErrorCode.UPSTREAM_ERROR,
-                        message=f"Solana RPC error: {data['error'].get('message', 'Unknown')}",
-                        source="solana_rpc",
-                        retryable=False
-                    )
-                
-                result = data.get("result", {})
-                return result.get("value"), None
+            
+            result = data.get("result", {})
+            return result.get("value"), None
                 
         except httpx.TimeoutException:
             return None, StructuredError(
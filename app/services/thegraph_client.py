@@ -21,6 +21,22 @@ class TheGraphClient:
         self.api_key = api_key or settings.thegraph_api_key
         self.timeout = 20.0
         self.gateway_url = "https://gateway.thegraph.com/api"
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use so connections are reused."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_keepalive_connections=50)
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
     def _get_subgraph_url(self, subgraph: str) -> str:
         """Build subgraph URL with API key."""
@@ -91,37 +107,37 @@ class TheGraphClient:
                 # The Graph Studio requires Authorization header
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    endpoint,
-                    json={
-                        "query": query,
-                        "variables": {"poolAddress": pool_address.lower()}
-                    },
-                    headers=headers
+            client = self._get_client()
+            response = await client.post(
+                endpoint,
+                json={
+                    "query": query,
+                    "variables": {"poolAddress": pool_address.lower()}
+                },
+                headers=headers
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "errors" in data:
+                return None, StructuredError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message=f"The Graph query error: {data['errors'][0].get('message', 'Unknown')}",
+                    source="thegraph",
+                    retryable=False
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "errors" in data:
-                    return None, StructuredError(
-                        code=ErrorCode.UPSTREAM_ERROR,
-                        message=f"The Graph query error: {data['errors'][0].get('message', 'Unknown')}",
-                        source="thegraph",
-                        retryable=False
-                    )
-                
-                pool = data.get("data", {}).get("pool")
-                if not pool:
-                    return None, StructuredError(
-                        code=ErrorCode.UPSTREAM_ERROR,
-                        message=f"Pool {pool_address} not found in subgraph",
-                        source="thegraph",
-                        retryable=False
-                    )
-                
-                return pool, None
-                
+            
+            pool = data.get("data", {}).get("pool")
+            if not pool:
+                return None, StructuredError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message=f"Pool {pool_address} not found in subgraph",
+                    source="thegraph",
+                    retryable=False
+                )
+            
+            return pool, None
+            
         except httpx.TimeoutException:
             return None, StructuredError(
                 code=ErrorCode.UPSTREAM_TIMEOUT,
@@ -272,36 +288,36 @@ class TheGraphClient:
                 # The Graph Studio requires Authorization header
                 headers["Authorization"] = f"Bearer {self.api_key}"
             
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    endpoint,
-                    json={
-                        "query": query,
-                        "variables": {
-                            "tokenAddress": token_address.lower(),
-                            "minTvl": str(min_tvl)
-                        }
-                    },
-                    headers=headers
+            client = self._get_client()
+            response = await client.post(
+                endpoint,
+                json={
+                    "query": query,
+                    "variables": {
+                        "tokenAddress": token_address.lower(),
+                        "minTvl": str(min_tvl)
+                    }
+                },
+                headers=headers
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if "errors" in data:
+                return None, StructuredError(
+                    code=ErrorCode.UPSTREAM_ERROR,
+                    message=f"The Graph query error: {data['errors'][0].get('message', 'Unknown')}",
+                    source="thegraph",
+                    retryable=False
                 )
-                response.raise_for_status()
-                data = response.json()
-                
-                if "errors" in data:
-                    return None, StructuredError(
-                        code=ErrorCode.UPSTREAM_ERROR,
-                        message=f"The Graph query error: {data['errors'][0].get('message', 'Unknown')}",
-                        source="thegraph",
-                        retryable=False
-                    )
-                
-                token = data.get("data", {}).get("token")
-                if not token:
-                    return [], None  # Token not found, but not an error
-                
-                pools = token.get("whitelistPools", [])
-                return pools, None
-                
+            
+            token = data.get("data", {}).get("token")
+            if not token:
+                return [], None  # Token not found, but not an error
+            
+            pools = token.get("whitelistPools", [])
+            return pools, None
+            
         except httpx.TimeoutException:
             return None, StructuredError(
                 code=ErrorCode.UPSTREAM_TIMEOUT,
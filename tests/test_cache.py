@@ -0,0 +1,175 @@
+"""
+AsyncTTLCache tests.
+Run with: python -m unittest discover -s tests
+"""
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from app.core.cache import AsyncTTLCache
+
+
+class _Clock:
+    """Stands in for time.monotonic so expiry can be stepped by hand."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _CountingFactory:
+    """Returns value after an optional gate opens; counts how often it was awaited."""
+
+    def __init__(self, value="v", gate: asyncio.Event = None, error: Exception = None):
+        self.value = value
+        self.gate = gate
+        self.error = error
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class CacheTestCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = _Clock()
+        patcher = mock.patch("app.core.cache.time", SimpleNamespace(monotonic=self.clock))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def assertNoLocksLeft(self, cache: AsyncTTLCache):
+        self.assertEqual(cache._locks, {})
+        self.assertEqual(cache._waiters, {})
+
+
+class CoalescingTest(CacheTestCase):
+
+    async def test_concurrent_misses_call_factory_once(self):
+        cache = AsyncTTLCache(ttl_seconds=60)
+        gate = asyncio.Event()
+        factory = _CountingFactory(gate=gate)
+
+        tasks = [asyncio.create_task(cache.get_or_set("k", factory)) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        results = await asyncio.gather(*tasks)
+
+        self.assertEqual(results, ["v"] * 5)
+        self.assertEqual(factory.calls, 1)
+        self.assertNoLocksLeft(cache)
+
+    async def test_hit_skips_factory(self):
+        cache = AsyncTTLCache(ttl_seconds=60)
+        factory = _CountingFactory()
+
+        await cache.get_or_set("k", factory)
+        self.assertEqual(await cache.get_or_set("k", factory), "v")
+
+        self.assertEqual(factory.calls, 1)
+
+
+class NotCachedTest(CacheTestCase):
+
+    async def test_exception_propagates_and_is_not_cached(self):
+        cache = AsyncTTLCache(ttl_seconds=60)
+        failing = _CountingFactory(error=RuntimeError("upstream down"))
+
+        with self.assertRaises(RuntimeError):
+            await cache.get_or_set("k", failing)
+
+        self.assertEqual(cache._entries, {})
+        self.assertNoLocksLeft(cache)
+        self.assertEqual(await cache.get_or_set("k", _CountingFactory()), "v")
+
+    async def test_concurrent_waiters_retry_after_failure(self):
+        cache = AsyncTTLCache(ttl_seconds=60)
+        gate = asyncio.Event()
+        failing = _CountingFactory(gate=gate, error=RuntimeError("upstream down"))
+        succeeding = _CountingFactory()
+
+        leader = asyncio.create_task(cache.get_or_set("k", failing))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(cache.get_or_set("k", succeeding))
+        await asyncio.sleep(0)
+        gate.set()
+
+        with self.assertRaises(RuntimeError):
+            await leader
+        self.assertEqual(await waiter, "v")
+        self.assertEqual(succeeding.calls, 1)
+        self.assertNoLocksLeft(cache)
+
+    async def test_cache_if_rejection_is_returned_but_not_stored(self):
+        cache = AsyncTTLCache(ttl_seconds=60)
+        factory = _CountingFactory(value=("result", ["upstream error"]))
+
+        value = await cache.get_or_set("k", factory, cache_if=lambda result: not result[1])
+        await cache.get_or_set("k", factory, cache_if=lambda result: not result[1])
+
+        self.assertEqual(value, ("result", ["upstream error"]))
+        self.assertEqual(factory.calls, 2)
+        self.assertEqual(cache._entries, {})
+        self.assertNoLocksLeft(cache)
+
+
+class ExpiryTest(CacheTestCase):
+
+    async def test_entry_expires_after_ttl(self):
+        cache = AsyncTTLCache(ttl_seconds=10)
+        factory = _CountingFactory()
+
+        await cache.get_or_set("k", factory)
+        self.clock.now += 9.9
+        await cache.get_or_set("k", factory)
+        self.assertEqual(factory.calls, 1)
+
+        self.clock.now += 0.1
+        await cache.get_or_set("k", factory)
+        self.assertEqual(factory.calls, 2)
+
+    async def test_clear_drops_entries(self):
+        cache = AsyncTTLCache(ttl_seconds=60)
+        factory = _CountingFactory()
+
+        await cache.get_or_set("k", factory)
+        cache.clear()
+        await cache.get_or_set("k", factory)
+
+        self.assertEqual(factory.calls, 2)
+
+
+class EvictionTest(CacheTestCase):
+
+    async def _fill(self, cache: AsyncTTLCache, *keys):
+        for key in keys:
+            await cache.get_or_set(key, _CountingFactory(value=key))
+            self.clock.now += 1
+
+    async def test_expired_entries_are_evicted_first(self):
+        cache = AsyncTTLCache(ttl_seconds=10, maxsize=3)
+        await self._fill(cache, "a", "b", "c")
+        self.clock.now = 1011.5
+
+        # "a" and "b" have both expired, so both go rather than just the oldest
+        await self._fill(cache, "d")
+
+        self.assertEqual(list(cache._entries), ["c", "d"])
+
+    async def test_oldest_insertion_is_evicted_when_none_expired(self):
+        cache = AsyncTTLCache(ttl_seconds=60, maxsize=3)
+        await self._fill(cache, "a", "b", "c", "d")
+
+        self.assertEqual(list(cache._entries), ["b", "c", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Multicall3 prefetch tests.
+Run with: python -m unittest discover -s tests
+"""
+import unittest
+from types import SimpleNamespace
+
+from eth_abi import encode
+
+from app.services.contract_analyzer import ContractAnalyzer
+from app.services.multicall import MulticallBatcher, calldata
+
+VALID = "0x1111111111111111111111111111111111111111"
+INVALID = "0x1234"
+OWNER = calldata("owner()")
+
+
+class _RecordingEth:
+    """Stands in for web3.eth: records eth_call requests and answers aggregate3 with one success per read."""
+
+    def __init__(self, answer: bytes = b""):
+        self.answer = answer
+        self.requests = []
+
+    async def call(self, request):
+        self.requests.append(request)
+        return encode(["(bool,bytes)[]"], [[(True, self.answer)]])
+
+    async def get_storage_at(self, address, slot):
+        raise AssertionError("detect_proxy should reject the address first")
+
+
+def _web3(eth: _RecordingEth) -> SimpleNamespace:
+    return SimpleNamespace(eth=eth)
+
+
+class PrefetchInvalidAddressTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_invalid_target_does_not_raise(self):
+        eth = _RecordingEth()
+        calls = await MulticallBatcher(_web3(eth)).prefetch([(INVALID, OWNER)])
+
+        self.assertEqual(eth.requests, [])
+        self.assertEqual(calls._results, {})
+
+    async def test_invalid_target_is_left_out_of_the_batch(self):
+        eth = _RecordingEth(answer=b"\x01" * 32)
+        calls = await MulticallBatcher(_web3(eth)).prefetch([(INVALID, OWNER), (VALID, OWNER)])
+
+        self.assertEqual(len(eth.requests), 1)
+        self.assertEqual(list(calls._results), [(VALID, OWNER)])
+        self.assertEqual(await calls.call(VALID, OWNER), b"\x01" * 32)
+
+    async def test_invalid_address_reaches_proxy_detection(self):
+        eth = _RecordingEth()
+        web3 = _web3(eth)
+        calls = await MulticallBatcher(web3).prefetch(ContractAnalyzer(web3).batch_calls(INVALID))
+
+        result = await ContractAnalyzer(web3).detect_proxy(INVALID, calls)
+
+        self.assertEqual(result, (False, None, "Invalid address"))
+
+
+if __name__ == "__main__":
+    unittest.main()